@@ -0,0 +1,127 @@
+import numpy as np
+
+import mhd_scaling as mhd
+from design_query import DEMO_TARGETS
+from property_state import property_state
+
+G = 9.81  # m/s^2
+
+
+def refine(func, x_range, y_range, n=9, max_depth=6, tol=0.0, log=(False, False)):
+    """Quadtree refinement of a 2D residual towards its zero contour.
+
+    The box is covered by a coarse ``n x n`` grid of cells. At every level
+    the cells whose corner residuals change sign, or come within ``tol`` of
+    zero, are split in four; all new corners of a level are evaluated in a
+    single vectorised call to ``func``. Cells far from the contour are never
+    subdivided, so the number of evaluations grows with the length of the
+    contour rather than with the area of the box.
+
+    Parameters
+    ----------
+    func : callable
+        ``func(X, Y)`` returning the residual for arrays of coordinates.
+    x_range, y_range : tuple of float
+        ``(min, max)`` of the box.
+    n : int, optional
+        Number of points per axis of the starting grid.
+    max_depth : int, optional
+        Number of refinement levels; the finest cells are ``2**max_depth``
+        times smaller than the starting ones.
+    tol : float, optional
+        Also refine cells with any ``|residual| <= tol``.
+    log : tuple of bool, optional
+        Subdivide the x and/or y axis uniformly in ``log10``.
+
+    Returns
+    -------
+    dict
+        ``x``, ``y``, ``value``: every evaluated point (unique), and
+        ``cells``: ``(m, 4)`` array of ``[x0, x1, y0, y1]`` for the finest
+        cells that still bracket the contour.
+    """
+    log = np.broadcast_to(log, 2)
+    to_axis = [np.log10 if flag else (lambda v: v) for flag in log]
+    from_axis = [(lambda v: 10**v) if flag else (lambda v: v) for flag in log]
+
+    def evaluate(u, v):
+        return func(from_axis[0](u), from_axis[1](v))
+
+    u = np.linspace(*to_axis[0](np.asarray(x_range, dtype=float)), n)
+    v = np.linspace(*to_axis[1](np.asarray(y_range, dtype=float)), n)
+    U, V = np.meshgrid(u, v, indexing="ij")
+    F = evaluate(U, V)
+    points = [(U.ravel(), V.ravel(), F.ravel())]
+
+    # Cells as [u0, u1, v0, v1] with corner values [f00, f10, f01, f11]
+    cells = np.column_stack([U[:-1, :-1].ravel(), U[1:, :-1].ravel(),
+                             V[:-1, :-1].ravel(), V[:-1, 1:].ravel()])
+    corners = np.column_stack([F[:-1, :-1].ravel(), F[1:, :-1].ravel(),
+                               F[:-1, 1:].ravel(), F[1:, 1:].ravel()])
+
+    def active(corners):
+        sign_change = (corners.min(axis=1) <= 0) & (corners.max(axis=1) >= 0)
+        return sign_change | (np.abs(corners).min(axis=1) <= tol)
+
+    for _ in range(max_depth):
+        keep = active(corners)
+        cells, corners = cells[keep], corners[keep]
+        if not len(cells):
+            break
+        u0, u1, v0, v1 = cells.T
+        um, vm = 0.5 * (u0 + u1), 0.5 * (v0 + v1)
+        # Edge midpoints and centre of every cell, in one batch
+        new_u = np.concatenate([um, u0, um, u1, um])
+        new_v = np.concatenate([v0, vm, vm, vm, v1])
+        new_f = evaluate(new_u, new_v)
+        points.append((new_u, new_v, new_f))
+        f_b, f_l, f_c, f_r, f_t = np.split(new_f, 5)
+        f00, f10, f01, f11 = corners.T
+        cells = np.concatenate([
+            np.column_stack([u0, um, v0, vm]),
+            np.column_stack([um, u1, v0, vm]),
+            np.column_stack([u0, um, vm, v1]),
+            np.column_stack([um, u1, vm, v1]),
+        ])
+        corners = np.concatenate([
+            np.column_stack([f00, f_b, f_l, f_c]),
+            np.column_stack([f_b, f10, f_c, f_r]),
+            np.column_stack([f_l, f_c, f01, f_t]),
+            np.column_stack([f_c, f_r, f_t, f11]),
+        ])
+    cells = cells[active(corners)]
+
+    u, v, f = (np.concatenate(p) for p in zip(*points))
+    unique = np.unique(np.column_stack([u, v]), axis=0, return_index=True)[1]
+    return {
+        "x": from_axis[0](u[unique]),
+        "y": from_axis[1](v[unique]),
+        "value": f[unique],
+        "cells": np.column_stack([from_axis[0](cells[:, :2]), from_axis[1](cells[:, 2:])]),
+    }
+
+
+def contour_points(cells):
+    """Centres of refined cells, sorted by x, e.g. for plotting the contour."""
+    x = cells[:, :2].mean(axis=1)
+    y = cells[:, 2:].mean(axis=1)
+    order = np.argsort(x)
+    return x[order], y[order]
+
+
+def length_match_residual(T_C, B=4.0, material="material_props", g=G,
+                          ha2_over_re=DEMO_TARGETS["I_ha2_over_re"],
+                          gr_over_ha2=DEMO_TARGETS["I_gr_over_ha2"]):
+    """``log10(L_Ha / L_Gr)`` as a vectorised function of ``(U, q'')``.
+
+    Its zero contour is where both DEMO interaction parameters are matched
+    with one characteristic length, as drawn by ``plotting.plot_length_match``.
+    """
+    s = property_state(material, T_C)
+
+    def residual(U, q):
+        L_ha = mhd.characteristic_length_from_Ha_ratio(B, s.sigma, s.rho, U, ha2_over_re)
+        L_gr = mhd.characteristic_length_from_Gr_ratio(
+            B, s.sigma, s.rho, s.nu, g, s.beta, q, s.k, gr_over_ha2)
+        return np.log10(L_ha / L_gr)
+    return residual
@@ -0,0 +1,224 @@
+"""Throughput benchmarks for the hot paths of the scaling studies.
+
+Each benchmark prepares a workload of roughly ``n`` design points, times it
+with :mod:`timeit` and reports the best time and points per second. Results
+can be saved as a JSON baseline and later runs compared against it::
+
+    python benchmarks.py --save baseline.json
+    python benchmarks.py --compare baseline.json --tolerance 0.25
+
+``--compare`` exits with status 1 when any benchmark is slower than the
+baseline by more than the tolerance, so it can gate CI jobs.
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+
+import numpy as np
+
+# name -> function(n) returning (callable, points)
+BENCHMARKS = {}
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+
+
+def benchmark(name, max_size=None):
+    """Register a workload factory under ``name``.
+
+    ``max_size`` skips sizes that would make slow reference paths (Python
+    loops, rendering) take minutes.
+    """
+    def register(factory):
+        BENCHMARKS[name] = (factory, max_size)
+        return factory
+    return register
+
+
+def _temperatures(n):
+    return np.linspace(300.0, 550.0, n)
+
+
+def _axes(n):
+    """(T, B, L, U, q) sweep axes with about ``n`` points in total."""
+    per_axis = max(2, int(round((n / 5) ** 0.25)))
+    return (
+        np.linspace(270, 550, 5),
+        np.linspace(1, 4, per_axis),
+        np.linspace(0.005, 0.1, per_axis),
+        np.linspace(0.0001, 0.005, per_axis),
+        np.linspace(1e5, 1e6, per_axis),
+    )
+
+
+@benchmark("material_props.scalar", max_size=100_000)
+def _material_props_scalar(n):
+    import material_props as props
+
+    T = _temperatures(n).tolist()
+
+    def run():
+        for T_C in T:
+            props.sigma(T_C), props.rho(T_C), props.nu(T_C), props.k(T_C), props.beta(T_C)
+    return run, n
+
+
+@benchmark("material_props.vector")
+def _material_props_vector(n):
+    import material_props as props
+
+    T = _temperatures(n)
+    return (lambda: props.properties(T)), n
+
+
+@benchmark("pb17li.correlations")
+def _pb17li_correlations(n):
+    import design_space as ds
+
+    T = _temperatures(n)
+    return (lambda: ds.fluid_properties(T)), n
+
+
+@benchmark("mhd_scaling.groups")
+def _mhd_groups(n):
+    import design_space as ds
+
+    rng = np.random.default_rng(0)
+    B, L, U, q = (rng.uniform(lo, hi, n) for lo, hi in
+                  ((1, 4), (0.005, 0.1), (1e-4, 5e-3), (1e5, 1e6)))
+    props = ds.fluid_properties(rng.uniform(300, 550, n))
+    return (lambda: ds.evaluate(B, L, U, q, props)), n
+
+
+@benchmark("design_space.sweep")
+def _sweep(n):
+    import design_space as ds
+
+    axes = _axes(n)
+    return (lambda: ds.sweep(*axes)), int(np.prod([a.size for a in axes]))
+
+
+@benchmark("design_space.stream_sweep")
+def _stream_sweep(n):
+    import design_space as ds
+
+    axes = _axes(n)
+
+    def run():
+        ds.stream_sweep(*axes, [ds.RangeReducer()], block_size=250_000)
+    return run, int(np.prod([a.size for a in axes]))
+
+
+@benchmark("design_space.dataframe")
+def _dataframe(n):
+    import design_space as ds
+
+    columns = ds.sweep(*_axes(n))
+    return (lambda: ds.to_dataframe(columns)), len(columns["Ha"])
+
+
+@benchmark("plotting.surface", max_size=100_000)
+def _plot_surface(n):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import plotting
+
+    side = max(2, int(n ** 0.5))
+    L_ha = np.linspace(1.0, 100.0, side)
+    L_gr = np.linspace(1.0, 10.0, side)
+    q = np.add.outer(L_gr, L_ha)
+
+    def run():
+        fig, _ = plotting.plot_Lha_Lgr_q(L_ha, L_gr, q)
+        fig.canvas.draw()
+        plt.close(fig)
+    return run, side * side
+
+
+def run_benchmarks(names=None, sizes=DEFAULT_SIZES, repeat=3):
+    """Time the selected benchmarks at each size.
+
+    Returns
+    -------
+    dict
+        ``{"name[n]": {"seconds": best, "points": points, "points_per_s": rate}}``
+    """
+    results = {}
+    for name in names or BENCHMARKS:
+        factory, max_size = BENCHMARKS[name]
+        for n in sizes:
+            if max_size is not None and n > max_size:
+                continue
+            func, points = factory(n)
+            timer = timeit.Timer(func)
+            number, _ = timer.autorange()
+            best = min(timer.repeat(repeat=repeat, number=number)) / number
+            results[f"{name}[{n}]"] = {
+                "seconds": best,
+                "points": points,
+                "points_per_s": points / best,
+            }
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Names of benchmarks slower than ``baseline`` by more than ``tolerance``."""
+    slower = []
+    for key, result in results.items():
+        if key in baseline:
+            ratio = result["seconds"] / baseline[key]["seconds"]
+            result["vs_baseline"] = ratio
+            if ratio > 1 + tolerance:
+                slower.append(key)
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("names", nargs="*", metavar="NAME",
+                        help=f"benchmarks to run (default: all of {sorted(BENCHMARKS)})")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="approximate number of points per workload")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", metavar="PATH", help="write results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="JSON baseline to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed relative slowdown against the baseline")
+    args = parser.parse_args(argv)
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    results = run_benchmarks(args.names, args.sizes, args.repeat)
+
+    slower = []
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        slower = compare(results, baseline, args.tolerance)
+
+    for key, result in results.items():
+        line = f"{key:<40} {result['seconds']:.3e} s  {result['points_per_s']:.3e} points/s"
+        if "vs_baseline" in result:
+            line += f"  x{result['vs_baseline']:.2f} vs baseline"
+        print(line)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({
+                "machine": platform.node(),
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "results": results,
+            }, f, indent=2)
+
+    if slower:
+        print(f"Slower than baseline: {', '.join(slower)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,14 @@
+import argparse
+import os
+
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-from itertools import product
-from scipy.spatial import ConvexHull
-from prop_correlations_Pb17atLi import *
+
+import design_space as ds
+from design_query import DesignIndex
+import result_store
+from envelope import IncrementalHull, box_corners
+from instrumentation import stage, timed
+from render import show_or_save, use_headless
 
 # Input ranges
 B_range = np.linspace(1, 4, 4)           # Tesla
@@ -12,103 +17,231 @@ U_range = np.linspace(0.0001, 0.005, 10) # m/s
 q_range = np.linspace(1e5, 1e6, 10)      # W/m^2
 T_C_range = np.linspace(270, 550, 5)     # Celsius
 
-G = 9.81  # m/s²
-
-results = []
-valid_temps = []
-
-for T_C in T_C_range:
-    T_K = T_C + 273.15
-    try:
-        # Check that temperature is within valid correlation ranges
-        rho = density(T_K)
-        nu = kinematicViscosity(T_K)
-        beta = volumetricThermalExpansionCoeff(T_K)
-        k = thermalConductivity(T_C) * 100  # W/cm.K to W/m.K
-        sigma = electricalConductivity(T_K)
-    except Exception as e:
-        print(f"⛔ Skipping T_C = {T_C} °C due to: {e}")
-        continue
-
-    count_before = len(results)
-
-    for B, L, U, q in product(B_range, L_range, U_range, q_range):
-        Ha = B * L * np.sqrt(sigma / (rho * nu))
-        Re = U * L / nu
-        Gr = G * beta * q * L**4 / (k * nu**2)
-        I_ha2_over_re = (Ha**2) / Re
-        I_gr_over_ha2 = Gr / (Ha**2)
-        I_gr_over_re2 = Gr / (Re**2)
-
-        results.append([
-            T_C, B, L, U, q, Ha, Re, Gr,
-            I_ha2_over_re, I_gr_over_ha2, I_gr_over_re2
-        ])
-
-    count_after = len(results)
-    print(f"✔ T_C = {T_C} °C — Data points added: {count_after - count_before}")
-    valid_temps.append(T_C)
-
-# Convert results to DataFrame
-df = pd.DataFrame(results, columns=[
-    "Temp_C", "B_T", "L_m", "U_mps", "q_Wm2",
-    "Ha", "Re", "Gr", "I_ha2_over_re", "I_gr_over_ha2", "I_gr_over_re2"
-])
-
-# Log-log Convex Hull plot
-df['log_Gr'] = np.log10(df['Gr'])
-df['log_I'] = np.log10(df['I_ha2_over_re'])
-
-points = df[['log_Gr', 'log_I']].dropna().values
-hull = ConvexHull(points)
-
-plt.figure(figsize=(10, 6))
-plt.scatter(10**df['log_Gr'], 10**df['log_I'], alpha=0.3, c='#002D5A', label='Data Points')
-for simplex in hull.simplices:
-    plt.plot(10**points[simplex, 0], 10**points[simplex, 1], color='#C00000', lw=2)  # Red
-
-
-plt.xscale('log')
-plt.yscale('log')
-plt.xlabel('Grashof Number (Gr)')
-plt.ylabel('Ha² / Re')
-plt.title('Experimental Capability Envelope: Ha²/Re vs Gr (Log-Log Scale)')
-plt.grid(True, which="both", linestyle='--', linewidth=0.5)
-plt.legend()
-plt.tight_layout()
-plt.show()
-
-# 🔍 Linear plot for the first valid temperature
-if valid_temps:
-    first_temp = valid_temps[0]
-    df_first = df[df["Temp_C"] == first_temp]
-
-    print(f"📌 Plotting data for T_C = {first_temp} °C — {len(df_first)} points")
-
-    plt.figure(figsize=(10, 6))
-    plt.scatter(df_first["Gr"], df_first["I_ha2_over_re"], c='green', alpha=0.6, label=f"{first_temp} °C")
+G = ds.G  # m/s²
+
+
+def capability_study(T_C=T_C_range, B=B_range, L=L_range, U=U_range, q=q_range, g=G,
+                     workers=1, split="Temp_C", envelope="grid", hull=None, store=None):
+    """Experimental capability study over the (T, B, L, U, q) design space.
+
+    Numeric only: nothing is plotted and none of pandas, matplotlib or
+    scipy is imported; the envelope and the nearest-design search are
+    numpy only (see :func:`envelope.hull_vertices` and
+    :meth:`design_query.DesignIndex.nearest`).
+
+    Parameters
+    ----------
+    T_C, B, L, U, q : array_like
+        1D sweep axes, as for :func:`design_space.sweep`.
+    g : float, optional
+        Gravitational acceleration [m/s^2].
+    workers : int, optional
+        Number of worker processes for the sweep.
+    split : str, optional
+        Design-space axis distributed across workers.
+    envelope : {"grid", "analytic"}, optional
+        Sample the full grid, or only the B, L, U, q box corners that bound
+        it.
+    hull : str, optional
+        Envelope file (.npz) to extend, created if missing.
+    store : str, optional
+        Result store in which the sweep columns are reused or saved.
+
+    Returns
+    -------
+    dict
+        ``valid`` (mask of usable temperatures in ``T_C``), ``columns``,
+        ``loaded`` (True if read from ``store``), ``envelope`` (closed
+        polygon of the Gr vs Ha^2/Re hull), ``summary`` (as
+        :func:`design_space.range_summary`) and ``nearest``
+        (``(distance, row)`` of the design closest to DEMO; None with
+        ``envelope="analytic"``, whose box corners are not a design grid).
+    """
+    T_C = np.asarray(T_C, dtype=float)
+    with stage("properties", points=T_C.size):
+        valid = ds.valid_temperatures(ds.fluid_properties(T_C))
+    loaded = False
+    if envelope == "analytic":
+        # Ranges and envelope of power-law groups are set by the box corners
+        columns = box_corners(T_C, B, L, U, q, g=g)
+    else:
+        spec = result_store.sweep_definition(T_C, B, L, U, q, g=g)
+        key = result_store.fingerprint(spec)
+        loaded = bool(store) and result_store.exists(key, store)
+        if loaded:
+            with stage("store"):
+                columns = result_store.load_columns(key, store)
+        else:
+            # Evaluate the design space, one broadcast pass per worker slice
+            with stage("sweep") as record:
+                columns = ds.parallel_sweep(T_C, B, L, U, q, workers=workers,
+                                            split=split, g=g)
+                record.points = len(columns["Temp_C"])
+            if store:
+                with stage("store"):
+                    result_store.save_columns(columns, key, store,
+                                              meta={"definition": spec})
+
+    # Merge this sweep into the (optionally persisted) capability envelope
+    if hull and os.path.exists(hull):
+        capability = IncrementalHull.load(hull)
+    else:
+        capability = IncrementalHull()
+    capability.update(columns)
+    if hull:
+        capability.save(hull)
+
+    nearest = None
+    if envelope != "analytic":
+        distance, rows = DesignIndex(columns).nearest()
+        nearest = (distance[0], rows[0])
+    return {
+        "valid": valid,
+        "columns": columns,
+        "loaded": loaded,
+        "envelope": capability.result(),
+        "summary": ds.range_summary(columns),
+        "nearest": nearest,
+    }
+
+
+@timed("plot")
+def plot_capability(columns, envelope, path=None, density=False):
+    """Log-log Ha²/Re vs Gr scatter of every design with its envelope.
+
+    With ``density`` the designs are binned and drawn as a raster (see
+    :func:`plotting.plot_capability_density`), which keeps the rendering
+    time and file size constant for sweeps of millions of points.
+    """
+    if density:
+        import plotting
+
+        fig, _ = plotting.plot_capability_density(
+            columns['Gr'], columns['I_ha2_over_re'], envelope)
+        return show_or_save(fig, path)
+
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(10, 6))
+    plt.scatter(columns['Gr'], columns['I_ha2_over_re'], alpha=0.3, c='#002D5A', label='Data Points')
+    plt.plot(envelope[:, 0], envelope[:, 1], color='#C00000', lw=2)  # Red
+
+
+    plt.xscale('log')
+    plt.yscale('log')
+    plt.xlabel('Grashof Number (Gr)')
+    plt.ylabel('Ha² / Re')
+    plt.title('Experimental Capability Envelope: Ha²/Re vs Gr (Log-Log Scale)')
+    plt.grid(True, which="both", linestyle='--', linewidth=0.5)
+    plt.legend()
+    plt.tight_layout()
+    return show_or_save(fig, path)
+
+
+@timed("plot")
+def plot_temperature(columns, T_C, path=None):
+    """Ha²/Re vs Gr of the designs at one temperature."""
+    import matplotlib.pyplot as plt
+
+    at_T = np.asarray(columns["Temp_C"]) == T_C
+    fig = plt.figure(figsize=(10, 6))
+    plt.scatter(np.asarray(columns["Gr"])[at_T], np.asarray(columns["I_ha2_over_re"])[at_T],
+                c='green', alpha=0.6, label=f"{T_C} °C")
     plt.xscale('log')
     plt.yscale('log')
     plt.xlabel("Grashof Number (Gr)")
     plt.ylabel("Ha² / Re")
-    plt.title(f"Ha² / Re vs Gr at {first_temp} °C (Linear Scale)")
+    plt.title(f"Ha² / Re vs Gr at {T_C} °C (Linear Scale)")
     plt.grid(True)
     plt.legend()
     plt.tight_layout()
-    plt.show()
-else:
-    print("⚠ No valid temperature data available for linear plot.")
-
-# 📊 Range Summary
-range_dict = {
-    "Ha": (df["Ha"].min(), df["Ha"].max()),
-    "Re": (df["Re"].min(), df["Re"].max()),
-    "Gr": (df["Gr"].min(), df["Gr"].max()),
-    "Ha^2 / Re": (df["I_ha2_over_re"].min(), df["I_ha2_over_re"].max()),
-    "Gr / Ha^2": (df["I_gr_over_ha2"].min(), df["I_gr_over_ha2"].max()),
-    "Gr / Re^2": (df["I_gr_over_re2"].min(), df["I_gr_over_re2"].max()),
-}
-
-print("\n📊 Experimental Capability Ranges:")
-for key, (min_val, max_val) in range_dict.items():
-    print(f" - {key:<12}: {min_val:.3e} to {max_val:.3e}")
+    return show_or_save(fig, path)
+
+
+def build_parser():
+    """Command-line options of :func:`main`."""
+    parser = argparse.ArgumentParser(description=capability_study.__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of worker processes for the sweep")
+    parser.add_argument("--split", choices=("Temp_C", "B_T"), default="Temp_C",
+                        help="design-space axis distributed across workers")
+    parser.add_argument("--hull", metavar="PATH",
+                        help="envelope file (.npz) to extend, created if missing")
+    parser.add_argument("--envelope", choices=("grid", "analytic"), default="grid",
+                        help="sample the full grid, or only the B, L, U, q box "
+                             "corners that bound it")
+    parser.add_argument("--store", metavar="DIR",
+                        help="reuse or save the sweep columns in this result store")
+    parser.add_argument("--out", metavar="DIR",
+                        help="save the figures here headlessly instead of showing them")
+    parser.add_argument("--density", action="store_true",
+                        help="draw the capability plot as a 2D histogram instead "
+                             "of a scatter of every design")
+    parser.add_argument("--no-plot", action="store_true",
+                        help="numeric results only; matplotlib is never imported")
+    return parser
+
+
+def main(argv=None):
+    """Run :func:`capability_study` from the command line and report it."""
+    args = build_parser().parse_args(argv)
+
+    result = capability_study(workers=args.workers, split=args.split,
+                              envelope=args.envelope, hull=args.hull, store=args.store)
+    columns = result["columns"]
+    valid_temps = list(T_C_range[result["valid"]])
+
+    # Check that each temperature is within valid correlation ranges
+    if args.envelope == "analytic":
+        points_per_temp = 2**4
+    else:
+        points_per_temp = B_range.size * L_range.size * U_range.size * q_range.size
+    for T_C, ok in zip(T_C_range, result["valid"]):
+        if ok:
+            print(f"✔ T_C = {T_C} °C — Data points added: {points_per_temp}")
+        else:
+            print(f"⛔ Skipping T_C = {T_C} °C due to: property correlation out of range")
+    if result["loaded"]:
+        print("📂 Loaded stored sweep")
+
+    if not args.no_plot:
+        if args.out:
+            use_headless()
+            os.makedirs(args.out, exist_ok=True)
+
+        def figure_path(name):
+            return os.path.join(args.out, name) if args.out else None
+
+        plot_capability(columns, result["envelope"], figure_path("capability_envelope.png"),
+                        density=args.density)
+
+        # 🔍 Linear plot for the first valid temperature
+        if valid_temps:
+            first_temp = valid_temps[0]
+            count = np.count_nonzero(np.asarray(columns["Temp_C"]) == first_temp)
+            print(f"📌 Plotting data for T_C = {first_temp} °C — {count} points")
+            plot_temperature(columns, first_temp, figure_path(f"capability_{first_temp:g}C.png"))
+        else:
+            print("⚠ No valid temperature data available for linear plot.")
+
+    # 📊 Range Summary
+    print("\n📊 Experimental Capability Ranges:")
+    for key, (min_val, max_val) in result["summary"].items():
+        print(f" - {key:<12}: {min_val:.3e} to {max_val:.3e}")
+
+
+    # 🎯 Design point closest to the DEMO interaction parameters
+    if result["nearest"] is None:
+        print("\n🎯 Closest design to DEMO: not searched, the analytic envelope "
+              "only samples the box corners")
+        return
+    distance, row = result["nearest"]
+    best = {name: values[row] for name, values in columns.items()}
+    print(f"\n🎯 Closest design to DEMO ({distance:.3f} decades away):")
+    print(f" - T = {best['Temp_C']:.1f} °C, B = {best['B_T']:.2f} T, L = {best['L_m']:.4f} m, "
+          f"U = {best['U_mps']:.2e} m/s, q'' = {best['q_Wm2']:.2e} W/m²")
+    print(f" - Ha^2 / Re = {best['I_ha2_over_re']:.3e}, Gr / Ha^2 = {best['I_gr_over_ha2']:.3e}")
+
+
+if __name__ == "__main__":
+    main()
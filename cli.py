@@ -0,0 +1,60 @@
+"""Single command-line entry point for the studies::
+
+    python cli.py capability --workers 4 --no-plot
+    python cli.py lmatch --out figures
+    python cli.py report --workers 4 --out report
+    python cli.py --profile profile.json capability --no-plot
+
+Commands are registered as ``"module:function"`` strings, as in
+:mod:`materials`, so only the selected study is imported. numpy, pandas
+and matplotlib are imported by that study, and only on the paths that
+need them; ``--no-plot`` runs import neither matplotlib nor pandas, and
+no study imports scipy. ``--profile``
+records the time, throughput and peak memory of every stage of the run
+(see :mod:`instrumentation`).
+"""
+import argparse
+import importlib
+
+# command: (loader, help)
+COMMANDS = {
+    "capability": ("calc_ha_re_gr:main",
+                   "experimental capability study over the (T, B, L, U, q) design space"),
+    "lmatch": ("run_simulation:cli",
+               "L(Ha)-L(Re)-U and L(Ha)-L(Gr)-q'' study at 330 C"),
+    "report": ("render:main",
+               "headless length-match report across temperatures"),
+}
+
+
+def main(argv=None):
+    """PbLi MHD scaling studies."""
+    parser = argparse.ArgumentParser(
+        description=main.__doc__,
+        epilog="commands:\n" + "\n".join(f"  {name:<12}{text}" for name, (_, text) in COMMANDS.items()),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--profile", metavar="PATH",
+                        help="write per-stage timing and memory as JSON ('-' for stdout)")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="with --profile, skip tracemalloc peak-memory tracking")
+    parser.add_argument("command", choices=COMMANDS, help="study to run")
+    parser.add_argument("options", nargs=argparse.REMAINDER,
+                        help="options of the command, see '<command> --help'")
+    args = parser.parse_args(argv)
+
+    module, function = COMMANDS[args.command][0].split(":")
+    run = getattr(importlib.import_module(module), function)
+    if not args.profile:
+        run(args.options)
+        return
+
+    import instrumentation
+
+    with instrumentation.profile(args.profile, memory=not args.no_memory,
+                                 command=args.command, options=args.options):
+        run(args.options)
+
+
+if __name__ == "__main__":
+    main()
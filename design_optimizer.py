@@ -0,0 +1,132 @@
+import numpy as np
+
+import mhd_scaling as mhd
+from design_query import DEMO_TARGETS
+import materials
+from property_state import property_arrays
+
+G = 9.81  # m/s^2
+
+# Facility limits
+B_RANGE = (0.5, 4.0)              # T
+L_RANGE = (1e-3, 0.1)             # m
+Q_FLUX_RANGE = (1e5, 1e6)         # W/m^2
+FLOW_RANGE = (1e-6, 6.0 / 3600)   # m^3/s, Q_max = 6 m^3/h
+T_W_RANGE = (1e-3, 1e-2)          # m, duct wall thickness
+
+# Design variables, solved for in log10 space
+VARIABLES = ("B", "L", "Q", "q", "t_w")
+
+# log10(Ha^2/Re), log10(Gr/Ha^2) and log10(c_w) are linear in log10 of the
+# variables. With the square-duct assumption U = Q / L^2:
+#   Ha^2/Re = B^2 L^3 sigma / (rho Q)
+#   Gr/Ha^2 = g beta q L^2 rho / (k nu B^2 sigma)
+#   c_w     = sigma_w t_w / (sigma L)
+_EXPONENTS = np.array([
+    [2.0, 3.0, -1.0, 0.0, 0.0],
+    [-2.0, 2.0, 0.0, 1.0, 0.0],
+    [0.0, -1.0, 0.0, 0.0, 1.0],
+])
+
+
+def nearest_to_demo(T_C, material="material_props",
+                    ha2_over_re=DEMO_TARGETS["I_ha2_over_re"],
+                    gr_over_ha2=DEMO_TARGETS["I_gr_over_ha2"],
+                    B_range=B_RANGE, L_range=L_RANGE, q_range=Q_FLUX_RANGE,
+                    flow_range=FLOW_RANGE, wall="EUROFER", c_w=None,
+                    t_w_range=T_W_RANGE, g=G, max_iter=500, tol=1e-12):
+    """Facility design closest to the DEMO interaction parameters.
+
+    Minimises the squared log10 distance of ``Ha^2/Re`` and ``Gr/Ha^2`` to
+    their targets over field, duct size, flow rate and heat flux, within the
+    facility limits. The velocity follows from the flow rate through a
+    square duct of side ``L`` (see ``run_simulation.velocities_from_flowrate``).
+    If a wall conductance ratio ``c_w`` is given it is matched as well, with
+    the wall thickness as an extra variable; otherwise the thickness stays at
+    the log-centre of ``t_w_range`` and the resulting ``c_w`` is reported.
+
+    In log space both groups are linear in the design variables, so the
+    problem is a box-constrained linear least-squares problem. It is solved
+    by projected gradient descent for all temperatures at once, starting
+    from the log-centre of the box; when the targets are reachable this
+    returns the exact match closest to that starting design.
+
+    Parameters
+    ----------
+    T_C : array_like or float
+        Operating temperature(s) [C]; every temperature is an independent
+        problem solved in the same vectorised iteration.
+    material : str, optional
+        Fluid in the :mod:`materials` registry.
+    ha2_over_re, gr_over_ha2 : float, optional
+        Target interaction parameters.
+    B_range, L_range, q_range, flow_range : tuple of float, optional
+        ``(min, max)`` of field [T], duct side [m], heat flux [W/m^2] and
+        volumetric flow rate [m^3/s].
+    wall : str, optional
+        Structural wall material in the :mod:`materials` registry.
+    c_w : float, optional
+        Target wall conductance ratio.
+    t_w_range : tuple of float, optional
+        ``(min, max)`` of the wall thickness [m].
+    g : float, optional
+        Gravitational acceleration [m/s^2].
+    max_iter : int, optional
+        Maximum number of projected-gradient iterations.
+    tol : float, optional
+        Stop once no variable moves by more than ``tol`` decades.
+
+    Returns
+    -------
+    dict
+        Arrays with the shape of ``T_C``: ``B``, ``L``, ``Q``, ``q``, ``U``,
+        ``t_w``, the achieved ``I_ha2_over_re``, ``I_gr_over_ha2`` and
+        ``c_w``, and ``log_distance`` (Euclidean distance to the targets in
+        decades).
+    """
+    T_C = np.asarray(T_C, dtype=float)
+    props = property_arrays(material, T_C.ravel())
+    sigma, rho, nu, k, beta = (props[name] for name in ("sigma", "rho", "nu", "k", "beta"))
+    sigma_w = materials.get(wall).properties(T_C.ravel())["sigma"]
+
+    # Right-hand side: target minus the property-dependent constant, per T
+    rhs = [
+        np.log10(ha2_over_re * rho / sigma),
+        np.log10(gr_over_ha2 * k * nu * sigma / (g * beta * rho)),
+    ]
+    A = _EXPONENTS[:2]
+    if c_w is not None:
+        rhs.append(np.log10(c_w * sigma / sigma_w))
+        A = _EXPONENTS
+    rhs = np.column_stack(rhs)
+    lower, upper = np.log10([B_range, L_range, flow_range, q_range, t_w_range]).T
+
+    step = 1.0 / np.linalg.norm(A, 2)**2
+    x = np.tile(0.5 * (lower + upper), (rhs.shape[0], 1))
+    for _ in range(max_iter):
+        residual = x @ A.T - rhs
+        x_new = np.clip(x - step * residual @ A, lower, upper)
+        converged = np.max(np.abs(x_new - x)) <= tol
+        x = x_new
+        if converged:
+            break
+
+    B, L, Q, q, t_w = (10**x[:, i] for i in range(len(VARIABLES)))
+    U = Q / L**2  # square cross-section, A = L^2
+    Ha = mhd.hartmann_number(B, L, sigma, rho, nu)
+    Re = mhd.reynolds_number(U, L, nu)
+    Gr = mhd.grashof_number(g, beta, q, L, k, nu)
+    result = {
+        "B": B, "L": L, "Q": Q, "q": q, "U": U, "t_w": t_w,
+        "I_ha2_over_re": Ha**2 / Re,
+        "I_gr_over_ha2": Gr / Ha**2,
+        "c_w": mhd.wall_conductance_ratio(sigma_w, t_w, sigma, L),
+    }
+    result["log_distance"] = np.hypot(
+        np.log10(result["I_ha2_over_re"] / ha2_over_re),
+        np.log10(result["I_gr_over_ha2"] / gr_over_ha2),
+    )
+    if c_w is not None:
+        result["log_distance"] = np.hypot(result["log_distance"],
+                                          np.log10(result["c_w"] / c_w))
+    return {name: value.reshape(T_C.shape) for name, value in result.items()}
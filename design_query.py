@@ -0,0 +1,84 @@
+import numpy as np
+
+from instrumentation import stage
+
+# DEMO reference interaction parameters
+DEMO_TARGETS = {"I_ha2_over_re": 8.22e5, "I_gr_over_ha2": 0.624}
+
+
+class DesignIndex:
+    """Query index over the interaction parameters of a precomputed sweep.
+
+    Points are indexed by ``log10`` of two columns (``Ha^2/Re`` and
+    ``Gr/Ha^2`` by default). The first coordinate is kept sorted, so a
+    tolerance window is bracketed by binary search and only the points
+    inside that band are tested on the second coordinate. Nearest-point
+    queries are one vectorised distance pass over both log coordinates,
+    which for a single target is cheaper than building a k-d tree and keeps
+    the index free of scipy.
+
+    Parameters
+    ----------
+    columns : dict or DataFrame
+        Sweep columns, e.g. from :func:`design_space.sweep` or
+        :func:`result_store.load_columns`.
+    x, y : str, optional
+        Names of the two indexed columns.
+    """
+
+    def __init__(self, columns, x="I_ha2_over_re", y="I_gr_over_ha2"):
+        self.columns = columns
+        self.names = (x, y)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_x = np.log10(np.asarray(columns[x], dtype=float))
+            log_y = np.log10(np.asarray(columns[y], dtype=float))
+        rows = np.flatnonzero(np.isfinite(log_x) & np.isfinite(log_y))
+        order = np.argsort(log_x[rows], kind="stable")
+        self._rows = rows[order]
+        self._log_x = log_x[self._rows]
+        self._log_y = log_y[self._rows]
+
+    def __len__(self):
+        return self._rows.size
+
+    def window(self, x_target=DEMO_TARGETS["I_ha2_over_re"],
+               y_target=DEMO_TARGETS["I_gr_over_ha2"], rtol=0.05):
+        """Rows with both columns within ``rtol`` of their targets.
+
+        ``rtol`` is a relative tolerance, or an ``(x_rtol, y_rtol)`` pair.
+
+        Returns
+        -------
+        ndarray
+            Row indices into ``columns``, in ascending order.
+        """
+        x_rtol, y_rtol = np.broadcast_to(rtol, 2)
+        lo = np.searchsorted(self._log_x, np.log10(x_target * (1 - x_rtol)), side="left")
+        hi = np.searchsorted(self._log_x, np.log10(x_target * (1 + x_rtol)), side="right")
+        band = self._log_y[lo:hi]
+        inside = (band >= np.log10(y_target * (1 - y_rtol))) & \
+                 (band <= np.log10(y_target * (1 + y_rtol)))
+        return np.sort(self._rows[lo:hi][inside])
+
+    def nearest(self, x_target=DEMO_TARGETS["I_ha2_over_re"],
+                y_target=DEMO_TARGETS["I_gr_over_ha2"], k=1):
+        """The ``k`` rows closest to the targets in log10 space.
+
+        Returns
+        -------
+        tuple of ndarray
+            ``(distance, rows)``: Euclidean distance in decades and row
+            indices into ``columns``, closest first.
+        """
+        with stage("nearest", points=self._rows.size):
+            distance = np.hypot(self._log_x - np.log10(x_target),
+                                self._log_y - np.log10(y_target))
+            k = min(k, distance.size)
+            i = np.argpartition(distance, k - 1)[:k] if k < distance.size else \
+                np.arange(distance.size)
+            i = i[np.argsort(distance[i], kind="stable")]
+        return distance[i], self._rows[i]
+
+    def select(self, rows):
+        """Columns restricted to ``rows``."""
+        return {name: np.asarray(self.columns[name])[rows] for name in self.columns}
@@ -0,0 +1,573 @@
+import copy
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import materials
+import mhd_scaling as mhd
+from instrumentation import stage
+
+G = 9.81  # m/s²
+
+# Sweep axes and derived groups, in the column order used by the studies
+AXES = ("Temp_C", "B_T", "L_m", "U_mps", "q_Wm2")
+GROUPS = ("Ha", "Re", "Gr", "I_ha2_over_re", "I_gr_over_ha2", "I_gr_over_re2")
+COLUMNS = AXES + GROUPS
+
+# Optional wall axes (index into the swept wall materials, thickness [m]) and
+# the wall conductance ratio they add
+WALL_AXES = ("wall", "t_w_m")
+WALL_GROUPS = ("c_w",)
+
+# Labels used for the "Experimental Capability Ranges" summary
+SUMMARY_LABELS = {
+    "Ha": "Ha",
+    "Re": "Re",
+    "Gr": "Gr",
+    "I_ha2_over_re": "Ha^2 / Re",
+    "I_gr_over_ha2": "Gr / Ha^2",
+    "I_gr_over_re2": "Gr / Re^2",
+    "c_w": "c_w",
+}
+
+
+def fluid_properties(T_C):
+    """Pb-17Li properties in SI units for an array of temperatures.
+
+    Shorthand for the ``"Pb17Li"`` entry of the :mod:`materials` registry.
+
+    Parameters
+    ----------
+    T_C : ndarray or float
+        Temperatures in Celsius. Any shape; the result has the same shape.
+
+    Returns
+    -------
+    dict
+        ``sigma`` [S/m], ``rho`` [kg/m^3], ``mu`` [Pa*s], ``nu`` [m^2/s],
+        ``k`` [W/m/K], ``beta`` [1/K] and ``cp`` [J/kg/K]. Temperatures
+        outside the range of correlations that are range checked give
+        ``NaN``.
+    """
+    return materials.get("Pb17Li").properties(T_C)
+
+
+def wall_conductivity(T_C, walls):
+    """Electrical conductivity [S/m] of each wall material at ``T_C`` [C].
+
+    Returns an array of shape ``T_C.shape + (len(walls),)``; the wall is
+    taken to be at the fluid temperature.
+    """
+    return np.stack(
+        [materials.get(name).properties(T_C)["sigma"] for name in walls], axis=-1
+    )
+
+
+def axis_names(walls=None):
+    """Names of the sweep axes, with :data:`WALL_AXES` if walls are swept."""
+    return AXES if walls is None else AXES + WALL_AXES
+
+
+def column_names(walls=None):
+    """Names of the sweep columns, with the wall columns if walls are swept."""
+    if walls is None:
+        return COLUMNS
+    return AXES + WALL_AXES + GROUPS + WALL_GROUPS
+
+
+def valid_temperatures(props):
+    """Boolean mask of temperatures for which every property is finite."""
+    return np.logical_and.reduce([np.isfinite(v) for v in props.values()])
+
+
+def evaluate(B, L, U, q, props, g=G, sigma_w=None, t_w=None):
+    """Dimensionless groups for broadcastable design arrays.
+
+    Parameters
+    ----------
+    B, L, U, q : ndarray or float
+        Magnetic field [T], characteristic length [m], velocity [m/s] and
+        surface heat flux [W/m^2]. Shapes must broadcast against each other
+        and against the arrays in ``props``.
+    props : dict
+        Material properties as returned by :func:`fluid_properties` or
+        :meth:`materials.Material.properties`.
+    g : float, optional
+        Gravitational acceleration [m/s^2].
+    sigma_w, t_w : ndarray or float, optional
+        Wall electrical conductivity [S/m] and thickness [m]. When given,
+        the wall conductance ratio ``c_w`` is added to the result.
+
+    Returns
+    -------
+    dict
+        Arrays for every name in :data:`GROUPS`, and :data:`WALL_GROUPS`
+        when the wall is given.
+    """
+    sigma, rho, nu = props["sigma"], props["rho"], props["nu"]
+    Ha = mhd.hartmann_number(B, L, sigma, rho, nu)
+    Re = mhd.reynolds_number(U, L, nu)
+    Gr = mhd.grashof_number(g, props["beta"], q, L, props["k"], nu)
+    Ha2 = Ha**2
+    groups = {
+        "Ha": Ha,
+        "Re": Re,
+        "Gr": Gr,
+        "I_ha2_over_re": Ha2 / Re,
+        "I_gr_over_ha2": Gr / Ha2,
+        "I_gr_over_re2": Gr / Re**2,
+    }
+    if sigma_w is not None:
+        groups["c_w"] = mhd.wall_conductance_ratio(sigma_w, t_w, sigma, L)
+    return groups
+
+
+def sweep_axes(T_C, B, L, U, q, material="Pb17Li", walls=None, t_w=None):
+    """1D axes with invalid temperatures removed.
+
+    With ``walls`` and ``t_w`` the wall axes are appended: the indices into
+    ``walls`` and the wall thicknesses.
+    """
+    if (walls is None) != (t_w is None):
+        raise ValueError("walls and t_w must be given together")
+    T_C = np.asarray(T_C, dtype=float).ravel()
+    valid = valid_temperatures(materials.get(material).properties(T_C))
+    if walls is not None:
+        valid &= np.isfinite(wall_conductivity(T_C, walls)).all(axis=-1)
+    axes = [T_C[valid]] + [np.asarray(a, dtype=float).ravel() for a in (B, L, U, q)]
+    if walls is not None:
+        axes += [np.arange(len(walls)), np.asarray(t_w, dtype=float).ravel()]
+    return axes
+
+
+def _sweep_grid(axes, g, material, walls):
+    """Broadcast evaluation of the Cartesian product of valid ``axes``."""
+    grid = np.ix_(*axes)
+    shape = tuple(a.size for a in axes)
+    with stage("properties", points=axes[0].size):
+        props = materials.get(material).properties(grid[0])
+        wall = {}
+        if walls is not None:
+            # (T, wall) table placed on the temperature and wall dimensions
+            sigma_w = wall_conductivity(axes[0], walls)[:, axes[5]]
+            wall["sigma_w"] = sigma_w.reshape(shape[:1] + (1,) * 4 + shape[5:6] + (1,))
+            wall["t_w"] = grid[6]
+
+    columns = {}
+    with stage("groups", points=int(np.prod(shape))):
+        for name, axis in zip(axis_names(walls), grid):
+            columns[name] = np.broadcast_to(axis, shape).ravel()
+        for name, value in evaluate(*grid[1:5], props, g=g, **wall).items():
+            columns[name] = np.broadcast_to(value, shape).ravel()
+    return columns
+
+
+def sweep(T_C, B, L, U, q, g=G, material="Pb17Li", walls=None, t_w=None):
+    """Evaluate the full (T, B, L, U, q) Cartesian product by broadcasting.
+
+    Each axis is placed on its own array dimension so the groups are only
+    expanded to the full grid when the ratios are formed. Temperatures at
+    which a range-checked correlation is invalid are dropped.
+
+    Parameters
+    ----------
+    T_C, B, L, U, q : array_like
+        1D sweep axes: temperature [C], field [T], length [m], velocity
+        [m/s] and heat flux [W/m^2].
+    g : float, optional
+        Gravitational acceleration [m/s^2].
+    material : str, optional
+        Fluid in the :mod:`materials` registry.
+    walls : sequence of str, optional
+        Structural materials in the :mod:`materials` registry to sweep as
+        duct walls. Requires ``t_w``.
+    t_w : array_like, optional
+        1D wall thickness axis [m]. Requires ``walls``.
+
+    Returns
+    -------
+    dict
+        Flat column arrays for every name in :func:`column_names`, ordered
+        like ``itertools.product(T_C, B, L, U, q[, walls, t_w])``. The
+        ``wall`` column holds indices into ``walls``.
+    """
+    return _sweep_grid(sweep_axes(T_C, B, L, U, q, material, walls, t_w),
+                       g, material, walls)
+
+
+def range_summary(columns):
+    """Minimum and maximum of each dimensionless group.
+
+    Returns
+    -------
+    dict
+        ``{label: (min, max)}`` keyed by :data:`SUMMARY_LABELS`.
+    """
+    return {
+        label: (np.nanmin(columns[name]), np.nanmax(columns[name]))
+        for name, label in SUMMARY_LABELS.items() if name in columns
+    }
+
+
+def to_dataframe(columns):
+    """Columnar :class:`pandas.DataFrame` view of sweep results."""
+    with stage("dataframe", points=len(next(iter(columns.values()), ()))):
+        import pandas as pd
+
+        return pd.DataFrame({name: columns[name] for name in columns}, copy=False)
+
+
+# Streaming sweeps ------------------------------------------------------------
+
+def _iter_grid(axes, block_size, g, material, walls):
+    """Blocks of the Cartesian product of valid ``axes``."""
+    names = axis_names(walls)
+    shape = tuple(a.size for a in axes)
+    total = int(np.prod(shape))
+    with stage("properties", points=axes[0].size):
+        props = materials.get(material).properties(axes[0])
+        if walls is not None:
+            sigma_w = wall_conductivity(axes[0], walls)[:, axes[5]]
+
+    for start in range(0, total, block_size):
+        index = np.unravel_index(
+            np.arange(start, min(start + block_size, total)), shape
+        )
+        with stage("groups", points=index[0].size):
+            block = {name: axis[i] for name, axis, i in zip(names, axes, index)}
+            block_props = {name: value[index[0]] for name, value in props.items()}
+            wall = {}
+            if walls is not None:
+                wall = {"sigma_w": sigma_w[index[0], index[5]], "t_w": block["t_w_m"]}
+            block.update(evaluate(*(block[name] for name in AXES[1:]), block_props,
+                                  g=g, **wall))
+        yield block
+
+
+def iter_blocks(T_C, B, L, U, q, block_size=1_000_000, g=G, material="Pb17Li",
+                walls=None, t_w=None):
+    """Walk the (T, B, L, U, q) Cartesian product in fixed-size blocks.
+
+    Only one block is held in memory at a time, so the footprint depends on
+    ``block_size`` and not on the size of the grid. Blocks follow the same
+    point order as :func:`sweep`.
+
+    Parameters
+    ----------
+    T_C, B, L, U, q : array_like
+        1D sweep axes, as for :func:`sweep`.
+    block_size : int, optional
+        Number of design points per block.
+    g : float, optional
+        Gravitational acceleration [m/s^2].
+    material : str, optional
+        Fluid in the :mod:`materials` registry.
+    walls, t_w : optional
+        Wall materials and thickness axis, as for :func:`sweep`.
+
+    Yields
+    ------
+    dict
+        Column arrays of length ``<= block_size`` for every name in
+        :func:`column_names`.
+    """
+    axes = sweep_axes(T_C, B, L, U, q, material, walls, t_w)
+    yield from _iter_grid(axes, block_size, g, material, walls)
+
+
+class RangeReducer:
+    """Running minimum and maximum of the dimensionless groups.
+
+    Parameters
+    ----------
+    names : sequence of str, optional
+        Columns to track; by default every group of a sweep over ``walls``.
+    walls : sequence of str, optional
+        Wall materials of the sweep, which add :data:`WALL_GROUPS`.
+    """
+
+    def __init__(self, names=None, walls=None):
+        if names is None:
+            names = GROUPS if walls is None else GROUPS + WALL_GROUPS
+        self.names = tuple(names)
+        self.min = {name: np.inf for name in self.names}
+        self.max = {name: -np.inf for name in self.names}
+
+    def update(self, block):
+        for name in self.names:
+            values = block[name]
+            if values.size:
+                self.min[name] = min(self.min[name], np.nanmin(values))
+                self.max[name] = max(self.max[name], np.nanmax(values))
+
+    def merge(self, other):
+        """Combine with a reducer that saw a different part of the grid."""
+        for name in self.names:
+            self.min[name] = min(self.min[name], other.min[name])
+            self.max[name] = max(self.max[name], other.max[name])
+
+    def result(self):
+        """Summary in the same form as :func:`range_summary`."""
+        return {
+            SUMMARY_LABELS.get(name, name): (self.min[name], self.max[name])
+            for name in self.names
+        }
+
+
+class HistogramReducer:
+    """Fixed-bin histogram of one or more columns, accumulated per block.
+
+    Parameters
+    ----------
+    columns : sequence of str
+        Column names, one per histogram dimension.
+    bins : int or sequence of int
+        Number of bins per dimension.
+    range : sequence of (float, float)
+        Bin range per dimension. The edges must be fixed up front because
+        the data is never held in memory at once.
+    log : bool, optional
+        Bin ``log10`` of the values (and ``range`` is given in decades).
+    """
+
+    def __init__(self, columns, bins, range, log=True):
+        self.columns = tuple(columns)
+        self.log = log
+        self.counts, self.edges = np.histogramdd(
+            np.empty((0, len(self.columns))), bins=bins, range=range
+        )
+
+    def update(self, block):
+        sample = np.column_stack([block[name] for name in self.columns])
+        if self.log:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                sample = np.log10(sample)
+        counts, _ = np.histogramdd(sample, bins=self.edges)
+        self.counts += counts
+
+    def merge(self, other):
+        """Combine with a reducer that saw a different part of the grid."""
+        self.counts += other.counts
+
+    def result(self):
+        """Counts and bin edges, as returned by :func:`numpy.histogramdd`."""
+        return self.counts, self.edges
+
+
+class FeasibleReducer:
+    """Keep only the points within a relative tolerance of target values.
+
+    Parameters
+    ----------
+    targets : dict
+        ``{column: target}``, e.g. ``{"I_ha2_over_re": 8.22e5}``.
+    rtol : float, optional
+        Relative tolerance applied to every target.
+    walls : sequence of str, optional
+        Wall materials of the sweep; only used for the columns of an empty
+        result when no block was ever seen.
+    """
+
+    def __init__(self, targets, rtol=0.05, walls=None):
+        self.targets = dict(targets)
+        self.rtol = rtol
+        self.columns = tuple(dict.fromkeys(column_names(walls) + tuple(self.targets)))
+        self._seen = False
+        self._blocks = []
+
+    def update(self, block):
+        # The columns actually produced, kept for an empty result
+        self.columns = tuple(block)
+        self._seen = True
+        mask = np.ones(len(block[AXES[0]]), dtype=bool)
+        for name, target in self.targets.items():
+            mask &= np.abs(block[name] - target) <= self.rtol * abs(target)
+        if mask.any():
+            self._blocks.append({name: v[mask] for name, v in block.items()})
+
+    def merge(self, other):
+        """Combine with a reducer that saw a different part of the grid."""
+        self._blocks.extend(other._blocks)
+        if other._seen and not self._seen:
+            self.columns, self._seen = other.columns, True
+
+    def result(self):
+        """Columns of the feasible points, in the columns of the sweep."""
+        return {
+            name: np.concatenate([b[name] for b in self._blocks] or [np.empty(0)])
+            for name in self.columns
+        }
+
+
+def _feed(blocks, reducers):
+    """Pass every block to every reducer; returns the number of points."""
+    count = 0
+    for block in blocks:
+        for reducer in reducers:
+            reducer.update(block)
+        count += len(block[AXES[0]])
+    return count
+
+
+def stream_sweep(T_C, B, L, U, q, reducers, block_size=1_000_000, g=G,
+                 material="Pb17Li", walls=None, t_w=None):
+    """Feed every block of the design space to a set of reducers.
+
+    Parameters
+    ----------
+    T_C, B, L, U, q : array_like
+        1D sweep axes, as for :func:`sweep`.
+    reducers : sequence
+        Objects with an ``update(block)`` method, e.g. :class:`RangeReducer`,
+        :class:`HistogramReducer` or :class:`FeasibleReducer`.
+    block_size : int, optional
+        Number of design points per block.
+    g : float, optional
+        Gravitational acceleration [m/s^2].
+    material : str, optional
+        Fluid in the :mod:`materials` registry.
+    walls, t_w : optional
+        Wall materials and thickness axis, as for :func:`sweep`.
+
+    Returns
+    -------
+    int
+        Number of design points processed.
+    """
+    blocks = iter_blocks(T_C, B, L, U, q, block_size=block_size, g=g,
+                         material=material, walls=walls, t_w=t_w)
+    return _feed(blocks, reducers)
+
+
+# Parallel sweeps -------------------------------------------------------------
+
+def _split_index(split, walls):
+    """Position of ``split`` among the sweep axes; ValueError if it is not one."""
+    names = axis_names(walls)
+    if split not in names:
+        raise ValueError(f"split must be one of {names}, got {split!r}")
+    return names.index(split)
+
+
+def _split_axes(T_C, B, L, U, q, split, workers, material, walls, t_w):
+    """Valid sweep axes and per-task axis tuples sliced along ``split``."""
+    index = _split_index(split, walls)
+    axes = sweep_axes(T_C, B, L, U, q, material, walls, t_w)
+    n_tasks = max(1, min(axes[index].size, 4 * workers))
+    tasks = []
+    for part in np.array_split(axes[index], n_tasks):
+        if part.size:
+            task = list(axes)
+            task[index] = part
+            tasks.append(task)
+    return axes, index, tasks
+
+
+def _run_tasks(func, tasks, workers):
+    """Map ``func`` over argument tuples, in a process pool if ``workers > 1``."""
+    if workers <= 1 or len(tasks) <= 1:
+        return [func(*task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, *zip(*tasks)))
+
+
+def _stream_task(axes, reducers, block_size, g, material, walls):
+    _feed(_iter_grid(axes, block_size, g, material, walls), reducers)
+    return reducers
+
+
+def parallel_sweep(T_C, B, L, U, q, workers=1, split="Temp_C", g=G,
+                   material="Pb17Li", walls=None, t_w=None):
+    """:func:`sweep` split across a process pool.
+
+    The axis named by ``split`` is cut into slices, each slice is swept in a
+    worker process and the columns are stitched back together, so the result
+    is identical to :func:`sweep` whatever the number of workers.
+
+    Parameters
+    ----------
+    T_C, B, L, U, q : array_like
+        1D sweep axes, as for :func:`sweep`.
+    workers : int, optional
+        Number of worker processes. ``1`` runs :func:`sweep` directly in
+        the calling process.
+    split : str, optional
+        Axis to distribute, one of :func:`axis_names`.
+    g : float, optional
+        Gravitational acceleration [m/s^2].
+    material : str, optional
+        Fluid in the :mod:`materials` registry.
+    walls, t_w : optional
+        Wall materials and thickness axis, as for :func:`sweep`.
+
+    Returns
+    -------
+    dict
+        Flat columns, as returned by :func:`sweep`.
+    """
+    if workers <= 1:
+        # One task in the calling process: nothing to split or stitch
+        _split_index(split, walls)
+        return sweep(T_C, B, L, U, q, g=g, material=material, walls=walls, t_w=t_w)
+    axes, index, tasks = _split_axes(T_C, B, L, U, q, split, workers, material,
+                                     walls, t_w)
+    parts = _run_tasks(_sweep_grid, [(task, g, material, walls) for task in tasks],
+                       workers)
+
+    shape = [a.size for a in axes]
+    columns = {}
+    for name in column_names(walls):
+        blocks = []
+        for task, part in zip(tasks, parts):
+            shape[index] = task[index].size
+            blocks.append(part[name].reshape(shape))
+        columns[name] = np.concatenate(blocks, axis=index).ravel()
+    return columns
+
+
+def parallel_stream_sweep(T_C, B, L, U, q, reducers, workers=1,
+                          split="Temp_C", block_size=1_000_000, g=G,
+                          material="Pb17Li", walls=None, t_w=None):
+    """:func:`stream_sweep` split across a process pool.
+
+    Every worker streams its slice of the grid into its own copy of
+    ``reducers``; the copies are then merged into ``reducers`` with their
+    ``merge`` method. Feasible points are returned grouped by slice.
+
+    Parameters
+    ----------
+    T_C, B, L, U, q : array_like
+        1D sweep axes, as for :func:`sweep`.
+    reducers : sequence
+        Picklable objects with ``update(block)`` and ``merge(other)``.
+    workers : int, optional
+        Number of worker processes. ``1`` runs :func:`stream_sweep`
+        directly in the calling process.
+    split : str, optional
+        Axis to distribute, one of :func:`axis_names`.
+    block_size : int, optional
+        Number of design points per block in each worker.
+    g : float, optional
+        Gravitational acceleration [m/s^2].
+    material : str, optional
+        Fluid in the :mod:`materials` registry.
+    walls, t_w : optional
+        Wall materials and thickness axis, as for :func:`sweep`.
+
+    Returns
+    -------
+    int
+        Number of design points processed.
+    """
+    if workers <= 1:
+        _split_index(split, walls)
+        return stream_sweep(T_C, B, L, U, q, reducers, block_size=block_size, g=g,
+                            material=material, walls=walls, t_w=t_w)
+    axes, _, tasks = _split_axes(T_C, B, L, U, q, split, workers, material,
+                                 walls, t_w)
+    args = [(task, copy.deepcopy(list(reducers)), block_size, g, material, walls)
+            for task in tasks]
+    for part in _run_tasks(_stream_task, args, workers):
+        for reducer, other in zip(reducers, part):
+            reducer.merge(other)
+    return int(np.prod([a.size for a in axes]))
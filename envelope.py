@@ -0,0 +1,175 @@
+import numpy as np
+
+import design_space as ds
+from instrumentation import stage
+
+
+def _cross(o, a, b):
+    """z component of ``(a - o) x (b - o)``; > 0 when ``o, a, b`` turn left."""
+    return (a[..., 0] - o[..., 0]) * (b[..., 1] - o[..., 1]) - \
+           (a[..., 1] - o[..., 1]) * (b[..., 0] - o[..., 0])
+
+
+def _chain(points, tol):
+    # One half of Andrew's monotone chain over points sorted by (x, y);
+    # turns within ``tol`` of straight count as collinear
+    chain = []
+    for x, y in points:
+        while len(chain) >= 2:
+            (ox, oy), (ax, ay) = chain[-2], chain[-1]
+            if (ax - ox) * (y - oy) - (ay - oy) * (x - ox) > tol:
+                break
+            chain.pop()
+        chain.append((x, y))
+    return chain
+
+
+def _monotone_chain(points):
+    # Hull of unique points sorted by (x, y), counter-clockwise, no collinear
+    # vertices. Points a rounding error off a hull edge (as the corners of a
+    # log-spaced grid often are) are merged into it, as Qhull does
+    tol = 1e-12 * np.ptp(points, axis=0).max() ** 2 if len(points) else 0.0
+    points = points.tolist()
+    lower = _chain(points, tol)
+    upper = _chain(points[::-1], tol)
+    return np.array(lower[:-1] + upper[:-1], dtype=float).reshape(-1, 2)
+
+
+def _discard_interior(points):
+    # Akl-Toussaint heuristic: drop the points strictly inside the polygon
+    # of the extremes along x, y and both diagonals, so that only a thin
+    # layer near the boundary reaches the Python loop of the monotone chain
+    extremes = np.unique(np.concatenate([
+        points[[np.argmin(d), np.argmax(d)]]
+        for d in (points[:, 0], points[:, 1],
+                  points[:, 0] + points[:, 1], points[:, 0] - points[:, 1])
+    ]), axis=0)
+    polygon = _monotone_chain(extremes)
+    if len(polygon) < 3:
+        return points
+    inside = np.ones(len(points), dtype=bool)
+    for a, b in zip(polygon, np.roll(polygon, -1, axis=0)):
+        inside &= _cross(a, b, points) > 0
+    return points[~inside]
+
+
+def hull_vertices(points):
+    """Vertices of the 2D convex hull of ``points``, counter-clockwise.
+
+    Non-finite points are ignored. Degenerate inputs (fewer than three
+    points, or all collinear) return their unique points unchanged. Pure
+    numpy (Andrew's monotone chain), so building an envelope never imports
+    scipy.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    with stage("hull", points=len(points)):
+        points = points[np.isfinite(points).all(axis=1)]
+        if len(points) < 3:
+            return np.unique(points, axis=0)
+        candidates = np.unique(_discard_interior(points), axis=0)
+        hull = _monotone_chain(candidates)
+        if len(hull) < 3:
+            return np.unique(points, axis=0)
+        return hull
+
+
+class IncrementalHull:
+    """Convex capability envelope built up block by block.
+
+    Only the current hull vertices are kept between updates, so each new
+    sweep block is merged against a handful of extreme points rather than
+    every point seen so far. It works as a reducer for
+    :func:`design_space.stream_sweep`.
+
+    Parameters
+    ----------
+    columns : tuple of str, optional
+        Sweep columns giving the x and y coordinates of each point.
+    log : bool, optional
+        Build the hull of ``log10`` of the column values.
+    vertices : ndarray, optional
+        Initial hull vertices, e.g. from a saved envelope.
+    """
+
+    def __init__(self, columns=("Gr", "I_ha2_over_re"), log=True, vertices=None):
+        self.columns = tuple(columns)
+        self.log = log
+        self.vertices = np.empty((0, 2)) if vertices is None else hull_vertices(vertices)
+
+    def add_points(self, points):
+        """Merge ``(N, 2)`` points, already in hull coordinates."""
+        self.vertices = hull_vertices(np.vstack([self.vertices, points]))
+
+    def update(self, block):
+        """Merge a block of sweep columns."""
+        points = np.column_stack([block[name] for name in self.columns])
+        if self.log:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                points = np.log10(points)
+        self.add_points(points)
+
+    def merge(self, other):
+        """Combine with a hull built from a different part of the grid."""
+        self.add_points(other.vertices)
+
+    def result(self):
+        """Closed polygon of the envelope in data (not log) coordinates."""
+        polygon = np.vstack([self.vertices, self.vertices[:1]])
+        return 10**polygon if self.log else polygon
+
+    def save(self, path):
+        """Persist the hull vertices to an ``.npz`` file."""
+        np.savez(path, vertices=self.vertices, columns=np.array(self.columns), log=self.log)
+
+    @classmethod
+    def load(cls, path):
+        """Reopen a hull written by :meth:`save`."""
+        with np.load(path) as data:
+            columns = tuple(str(name) for name in data["columns"])
+            return cls(columns, bool(data["log"]), data["vertices"])
+
+
+# Analytic envelopes ----------------------------------------------------------
+
+def box_corners(T_C, B, L, U, q, g=ds.G):
+    """Sweep columns at the 2^4 corners of the (B, L, U, q) box per temperature.
+
+    Ha, Re, Gr and their ratios are products of powers of B, L, U and q, so
+    in log coordinates they are linear functions of the logs of the inputs.
+    Over a box of positive inputs their extremes, and the convex hull of any
+    pair of them in log space, are therefore attained at the box corners.
+    Every grid that includes the end points of each axis has the same range
+    summary and log-log envelope as its corners.
+
+    Parameters
+    ----------
+    T_C : array_like
+        Temperatures [C]; each is handled separately since the properties
+        are not power laws in temperature.
+    B, L, U, q : array_like
+        Sweep axes or just their ``(min, max)`` bounds. Values must be > 0.
+    g : float, optional
+        Gravitational acceleration [m/s^2].
+
+    Returns
+    -------
+    dict
+        Flat columns, as returned by :func:`design_space.sweep`.
+    """
+    bounds = [(np.min(axis), np.max(axis)) for axis in (B, L, U, q)]
+    return ds.sweep(T_C, *bounds, g=g)
+
+
+def analytic_envelope(T_C, B, L, U, q, g=ds.G, columns=("Gr", "I_ha2_over_re")):
+    """Range summary and capability envelope from the box corners alone.
+
+    Returns
+    -------
+    tuple
+        ``(summary, hull)``: the :func:`design_space.range_summary` of the
+        design space and an :class:`IncrementalHull` of ``columns``.
+    """
+    corners = box_corners(T_C, B, L, U, q, g=g)
+    hull = IncrementalHull(columns)
+    hull.update(corners)
+    return ds.range_summary(corners), hull
@@ -0,0 +1,208 @@
+"""Stage-level timing and memory instrumentation of the studies.
+
+Library code marks its stages with :func:`stage` (or the :func:`timed`
+decorator); these cost a single check while no profiler is active. Enable
+one to record, per stage, the wall time, points processed, points per
+second and peak traced memory, and write them as JSON::
+
+    import instrumentation
+
+    with instrumentation.profile("profile.json"):
+        calc_ha_re_gr.capability_study()
+
+or from the command line with ``python cli.py --profile profile.json ...``.
+Stages that run in worker processes are not recorded.
+"""
+import functools
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+
+# json, platform and tracemalloc are imported by the profiler itself, so
+# importing this module for its no-op hooks stays cheap
+
+_active = None
+
+
+class _Record:
+    """Handle of a running stage; set ``points`` if known only at the end."""
+
+    __slots__ = ("points",)
+
+    def __init__(self, points=None):
+        self.points = points
+
+
+class Profiler:
+    """Accumulates stage statistics by stage name.
+
+    Parameters
+    ----------
+    memory : bool, optional
+        Record peak memory with :mod:`tracemalloc`. Tracing slows
+        allocation-heavy code down noticeably.
+    """
+
+    def __init__(self, memory=True):
+        import tracemalloc
+
+        self._tracemalloc = tracemalloc
+        self.memory = memory
+        self.stages = {}
+        self._peaks = []  # running peak of every open stage
+        self._tracing = False
+        self._start = None
+        self._started = None
+        self._elapsed = None
+
+    def start(self):
+        if self.memory and not self._tracemalloc.is_tracing():
+            self._tracemalloc.start()
+            self._tracing = True
+        self._started = time.strftime("%Y-%m-%dT%H:%M:%S%z")
+        self._start = time.perf_counter()
+
+    def stop(self):
+        self._elapsed = time.perf_counter() - self._start
+        if self._tracing:
+            self._tracemalloc.stop()
+            self._tracing = False
+
+    @contextmanager
+    def stage(self, name, points=None):
+        """Record one execution of stage ``name``."""
+        record = _Record(points)
+        tracemalloc = self._tracemalloc
+        if self.memory:
+            baseline, peak = tracemalloc.get_traced_memory()
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            self._peaks.append(baseline)
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            elapsed = time.perf_counter() - start
+            extra = None
+            if self.memory:
+                peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+                tracemalloc.reset_peak()
+                extra = peak - baseline
+            self._add(name, elapsed, record.points, extra)
+
+    def _add(self, name, elapsed, points, peak):
+        entry = self.stages.setdefault(
+            name, {"calls": 0, "wall_time_s": 0.0, "points": None, "peak_memory_bytes": None}
+        )
+        entry["calls"] += 1
+        entry["wall_time_s"] += elapsed
+        if points is not None:
+            entry["points"] = (entry["points"] or 0) + int(points)
+        if peak is not None:
+            entry["peak_memory_bytes"] = max(entry["peak_memory_bytes"] or 0, peak)
+
+    def report(self, **meta):
+        """JSON-serialisable summary of the run, with ``meta`` added on top.
+
+        ``peak_memory_bytes`` is the peak traced memory above the level at
+        the start of the stage, over all its calls.
+        """
+        import platform
+
+        stages = []
+        for name, entry in self.stages.items():
+            entry = dict(name=name, **entry)
+            points, seconds = entry["points"], entry["wall_time_s"]
+            entry["points_per_s"] = points / seconds if points and seconds > 0 else None
+            stages.append(entry)
+        return dict(
+            meta,
+            started=self._started,
+            wall_time_s=(time.perf_counter() - self._start if self._elapsed is None
+                         else self._elapsed),
+            python=platform.python_version(),
+            memory_traced=self.memory,
+            stages=stages,
+        )
+
+    def save(self, path, **meta):
+        """Write :meth:`report` to ``path`` (``"-"`` for stdout)."""
+        import json
+
+        text = json.dumps(self.report(**meta), indent=2)
+        if path == "-":
+            print(text, file=sys.stdout)
+        else:
+            with open(path, "w") as f:
+                f.write(text + "\n")
+
+
+def active():
+    """The running :class:`Profiler`, or None."""
+    return _active
+
+
+def stage(name, points=None):
+    """Context manager around one stage; a no-op unless profiling.
+
+    Yields a handle whose ``points`` attribute may be set inside the block.
+    """
+    if _active is None:
+        return nullcontext(_Record(points))
+    return _active.stage(name, points)
+
+
+def timed(name=None, points=None):
+    """Decorator recording every call of a function as a stage.
+
+    Parameters
+    ----------
+    name : str, optional
+        Stage name; defaults to the function's qualified name.
+    points : callable, optional
+        ``points(result)`` giving the number of points processed.
+    """
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(label) as record:
+                result = func(*args, **kwargs)
+                if points is not None:
+                    record.points = points(result)
+            return result
+        return wrapper
+    return decorator
+
+
+def enable(memory=True):
+    """Start a new :class:`Profiler` and make it the active one."""
+    global _active
+    _active = Profiler(memory)
+    _active.start()
+    return _active
+
+
+def disable():
+    """Stop and return the active profiler."""
+    global _active
+    profiler, _active = _active, None
+    if profiler is not None:
+        profiler.stop()
+    return profiler
+
+
+@contextmanager
+def profile(path=None, memory=True, **meta):
+    """Profile the enclosed block, writing the report to ``path`` if given."""
+    profiler = enable(memory)
+    try:
+        yield profiler
+    finally:
+        disable()
+        if path:
+            profiler.save(path, **meta)
@@ -0,0 +1,171 @@
+"""Outer-product grids stored as one 1D factor per axis.
+
+Every function in :mod:`mhd_scaling` listed in ``EXPONENTS`` is a power law,
+so on a grid spanned by 1D axes it is a constant times one factor per axis.
+:class:`FactoredGrid` keeps only those factors, which makes an ``N x N`` (or
+``N x N x N``) map cost ``O(N)`` memory until it is materialised, either as
+a whole through ``np.asarray(grid)`` or tile by tile::
+
+    q = power_law_grid(mhd.heat_flux_from_length, {"L_gr": L_gr},
+                       B=4.0, sigma=sigma, rho=rho, nu=nu, g=9.81,
+                       beta=beta, k=k, gr_over_ha2=0.624)
+    for rows, block in q.tiles(1024):
+        ...
+"""
+import numpy as np
+
+import mhd_scaling as mhd
+
+
+class FactoredGrid:
+    """``scale * f_0[i] * f_1[j] * ...`` on the outer product of 1D axes.
+
+    A factor of length 1 broadcasts along its axis, like a NumPy dimension
+    of size 1, so a map that does not depend on an axis stores a single
+    value for it.
+
+    Parameters
+    ----------
+    factors : sequence of array_like
+        One 1D factor per axis, in axis order.
+    scale : float, optional
+        Constant multiplying every factor.
+    """
+
+    def __init__(self, factors, scale=1.0):
+        self.factors = tuple(np.asarray(f, dtype=float).ravel() for f in factors)
+        self.scale = float(scale)
+
+    def __repr__(self):
+        return f"FactoredGrid(shape={self.shape}, scale={self.scale:g})"
+
+    @property
+    def shape(self):
+        return tuple(f.size for f in self.factors)
+
+    @property
+    def ndim(self):
+        return len(self.factors)
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    @property
+    def dtype(self):
+        return np.dtype(float)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the factors, not by the materialised grid."""
+        return sum(f.nbytes for f in self.factors)
+
+    def _open(self, factors):
+        # Each factor reshaped to broadcast along its own axis only
+        ndim = len(factors)
+        return [f.reshape((-1,) + (1,) * (ndim - axis - 1)) for axis, f in enumerate(factors)]
+
+    def _product(self, factors):
+        out = np.full((), self.scale)
+        for f in self._open(factors):
+            out = out * f
+        return out
+
+    def materialize(self):
+        """The full grid as an ndarray of shape :attr:`shape`."""
+        return self._product(self.factors)
+
+    def __array__(self, dtype=None, copy=None):
+        out = self.materialize()
+        return out if dtype is None else out.astype(dtype, copy=False)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        """Materialise one tile; ``key`` holds an int or slice per axis."""
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) > self.ndim or not all(isinstance(k, (int, np.integer, slice)) for k in key):
+            raise IndexError("FactoredGrid supports only integers and slices, one per axis")
+        key = key + (slice(None),) * (self.ndim - len(key))
+        block = self._product([np.atleast_1d(f[k]) for k, f in zip(key, self.factors)])
+        return block[tuple(0 if isinstance(k, (int, np.integer)) else slice(None) for k in key)]
+
+    def expand_dims(self, axis):
+        """Insert a length-1 axis at ``axis``, like :func:`numpy.expand_dims`."""
+        factors = list(self.factors)
+        factors.insert(axis if axis >= 0 else self.ndim + axis + 1, np.ones(1))
+        return FactoredGrid(factors, self.scale)
+
+    def tiles(self, rows):
+        """Iterate over ``(slice, ndarray)`` blocks of ``rows`` along axis 0."""
+        for start in range(0, len(self), rows):
+            index = slice(start, min(start + rows, len(self)))
+            yield index, self[index]
+
+    # Arithmetic stays factored ---------------------------------------------
+
+    def _combine(self, other, op):
+        if isinstance(other, FactoredGrid):
+            if other.ndim != self.ndim:
+                raise ValueError(f"cannot combine grids of shapes {self.shape} and {other.shape}")
+            factors = [op(a, b) for a, b in zip(self.factors, other.factors)]
+            return FactoredGrid(factors, op(self.scale, other.scale))
+        if np.ndim(other) == 0:
+            return FactoredGrid(self.factors, op(self.scale, float(other)))
+        return NotImplemented
+
+    def __mul__(self, other):
+        return self._combine(other, np.multiply)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        return self._combine(other, np.divide)
+
+    def __rtruediv__(self, other):
+        return (self ** -1) * other
+
+    def __pow__(self, exponent):
+        if np.ndim(exponent) != 0:
+            return NotImplemented
+        return FactoredGrid([f ** exponent for f in self.factors], self.scale ** exponent)
+
+    def __neg__(self):
+        return self * -1.0
+
+
+def power_law_grid(func, axes, **arguments):
+    """Evaluate a power law of :mod:`mhd_scaling` as a :class:`FactoredGrid`.
+
+    Parameters
+    ----------
+    func : callable
+        A function listed in :data:`mhd_scaling.EXPONENTS`.
+    axes : dict
+        ``{argument: 1D values}`` spanning the grid, in axis order.
+    **arguments : float
+        The remaining arguments of ``func``, as scalars.
+
+    Returns
+    -------
+    FactoredGrid or tuple of FactoredGrid
+        The grid of ``func`` over ``axes``; a tuple for functions returning
+        a tuple. Equal to evaluating ``func`` on ``np.meshgrid(*axes.values(),
+        indexing="ij")``.
+    """
+    exponents = mhd.EXPONENTS[func.__name__]
+    # f = f(axes at 1) * prod x**e, one scalar evaluation and one 1D power per axis
+    value = func(**arguments, **{name: 1.0 for name in axes})
+
+    def grid(scale, exponent):
+        return FactoredGrid(
+            [np.asarray(values, dtype=float) ** exponent.get(name, 0)
+             for name, values in axes.items()],
+            scale,
+        )
+
+    if isinstance(value, tuple):
+        return tuple(grid(v, e) for v, e in zip(value, exponents))
+    return grid(value, exponents)
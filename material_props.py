@@ -1,5 +1,6 @@
 import numpy as np
-from scipy.interpolate import interp1d
+
+from property_table import PropertyTable
 
 # Data for PbLi properties as a function of temperature (Celsius)
 # Values are approximate and for demonstration only.
@@ -12,32 +13,50 @@ _mu = np.array([2.5e-3, 2.0e-3, 1.7e-3, 1.5e-3])   # dynamic viscosity, Pa*s
 _k = np.array([15.0, 16.0, 17.0, 17.5])            # thermal conductivity, W/m/K
 _beta = np.array([1.1e-4, 1.15e-4, 1.20e-4, 1.23e-4])  # thermal expansion, 1/K
 
-_sigma_interp = interp1d(_T_C, _sigma, fill_value="extrapolate")
-_rho_interp = interp1d(_T_C, _rho, fill_value="extrapolate")
-_mu_interp = interp1d(_T_C, _mu, fill_value="extrapolate")
-_k_interp = interp1d(_T_C, _k, fill_value="extrapolate")
-_beta_interp = interp1d(_T_C, _beta, fill_value="extrapolate")
+# One table for every property: a single bracketing search per call
+TABLE = PropertyTable(_T_C, sigma=_sigma, rho=_rho, mu=_mu, k=_k, beta=_beta)
+
+
+def _lookup(name, T_C):
+    """Float for scalar temperatures, array otherwise."""
+    if np.ndim(T_C) == 0:
+        return TABLE.scalar(float(T_C), name)
+    return TABLE(T_C, (name,))[name]
+
+
+def properties(T_C):
+    """All properties (sigma, rho, mu, k, beta, nu) in one vectorised pass.
+
+    Returns a dict of arrays with the shape of ``T_C``.
+    """
+    props = TABLE(T_C)
+    props["nu"] = props["mu"] / props["rho"]
+    return props
 
 def sigma(T_C):
     """Electrical conductivity as a function of temperature in Celsius."""
-    return float(_sigma_interp(T_C))
+    return _lookup("sigma", T_C)
 
 def rho(T_C):
     """Density as a function of temperature in Celsius."""
-    return float(_rho_interp(T_C))
+    return _lookup("rho", T_C)
 
 def mu(T_C):
     """Dynamic viscosity (Pa*s) as a function of temperature in Celsius."""
-    return float(_mu_interp(T_C))
+    return _lookup("mu", T_C)
 
 def k(T_C):
     """Thermal conductivity as a function of temperature in Celsius."""
-    return float(_k_interp(T_C))
+    return _lookup("k", T_C)
 
 def beta(T_C):
     """Thermal expansion coefficient as a function of temperature in Celsius."""
-    return float(_beta_interp(T_C))
+    return _lookup("beta", T_C)
 
 def nu(T_C):
     """Kinematic viscosity as a function of temperature in Celsius."""
-    return mu(T_C) / rho(T_C)
+    if np.ndim(T_C) == 0:
+        T_C = float(T_C)
+        return TABLE.scalar(T_C, "mu") / TABLE.scalar(T_C, "rho")
+    props = TABLE(T_C, ("mu", "rho"))
+    return props["mu"] / props["rho"]
@@ -0,0 +1,178 @@
+"""Registry of fluid and structural materials.
+
+Every material is exposed through :class:`Material` with one vectorised
+``properties(T_C)`` call returning SI units. Registration only records the
+name of the module and function that evaluate a material, so nothing is
+imported until a material is first used::
+
+    import materials
+
+    props = materials.get("Pb17Li").properties(T_C)
+    for name in materials.names(kind="structural"):
+        sigma_w = materials.get(name).properties(T_C)["sigma"]
+"""
+import importlib
+
+import numpy as np
+
+_REGISTRY = {}
+
+
+class Material:
+    """A registered material, loaded lazily on first use.
+
+    Parameters
+    ----------
+    name : str
+        Registry key.
+    kind : {"fluid", "structural"}
+        Fluids provide ``sigma``, ``rho``, ``mu``, ``nu``, ``k`` and ``beta``
+        (and ``cp`` [J/kg/K] where it is known); structural materials
+        ``sigma``, and ``rho`` and ``k`` where a correlation for the alloy
+        is available.
+    loader : str
+        ``"module:function"`` returning a dict of SI property arrays for an
+        array of temperatures in Celsius.
+    valid_range : dict
+        ``{property: (T_min, T_max)}`` in Celsius where the underlying
+        correlations or data are valid.
+    description : str, optional
+        Source of the data.
+    """
+
+    def __init__(self, name, kind, loader, valid_range, description=""):
+        self.name = name
+        self.kind = kind
+        self.loader = loader
+        self.valid_range = dict(valid_range)
+        self.description = description
+        self._function = None
+
+    def __repr__(self):
+        return f"Material({self.name!r}, kind={self.kind!r}, loader={self.loader!r})"
+
+    def properties(self, T_C):
+        """SI properties at temperatures ``T_C`` [C], one array per property."""
+        if self._function is None:
+            module, function = self.loader.split(":")
+            self._function = getattr(importlib.import_module(module), function)
+        return self._function(np.asarray(T_C, dtype=float))
+
+    def in_range(self, T_C, names=None):
+        """Mask of temperatures inside the validity range of ``names``."""
+        T_C = np.asarray(T_C, dtype=float)
+        mask = np.ones(T_C.shape, dtype=bool)
+        for name in names or self.valid_range:
+            lower, upper = self.valid_range[name]
+            mask &= (T_C >= lower) & (T_C <= upper)
+        return mask
+
+
+def register(name, kind, loader, valid_range, description=""):
+    """Add a material to the registry (replacing any of the same name)."""
+    _REGISTRY[name] = Material(name, kind, loader, valid_range, description)
+    return _REGISTRY[name]
+
+
+def get(name):
+    """The registered :class:`Material` called ``name``."""
+    try:
+        return _REGISTRY[name]
+    except KeyError:
+        raise KeyError(f"unknown material {name!r}; expected one of {sorted(_REGISTRY)}") from None
+
+
+def names(kind=None):
+    """Registered material names, optionally only those of one ``kind``."""
+    return [name for name, m in _REGISTRY.items() if kind is None or m.kind == kind]
+
+
+# Loaders normalising each property module to SI ----------------------------
+
+def _celsius_to_kelvin(T_C):
+    return T_C + 273.15
+
+
+def pb17li_properties(T_C):
+    """Pb-17Li correlations (prop_correlations_Pb17atLi) in SI units.
+
+    Temperatures outside the range of the range-checked correlations
+    (``beta`` and ``cp``) give ``NaN``.
+    """
+    import prop_correlations_Pb17atLi as pbli
+
+    T_K = _celsius_to_kelvin(T_C)
+    # Density and viscosity once each; kinematicViscosity would evaluate
+    # density a second time
+    rho = pbli.density(T_K)
+    mu = pbli.dynamicViscosity(T_K)
+    return {
+        "sigma": pbli.electricalConductivity(T_K),
+        "rho": rho,
+        "mu": mu,
+        "nu": mu / rho,
+        "k": pbli.thermalConductivity(T_C) * 100,  # W/cm.K to W/m.K
+        "beta": pbli.volumetricThermalExpansionCoeff(T_K, outOfRange="nan"),
+        # J/g/K to J/kg/K; same 508 - 880 K range as beta, so no extra NaNs
+        "cp": pbli.specificHeat(T_K, outOfRange="nan") * 1000,
+    }
+
+
+def ss316l_properties(T_C):
+    """316L structural properties (prop_correlations_316L) in SI units."""
+    import prop_correlations_316L as ss316l
+
+    T_K = _celsius_to_kelvin(T_C)
+    return {
+        "sigma": ss316l.electricalConductivity(T_K),
+        "rho": ss316l.density(T_K),
+        "k": ss316l.thermalConductivity(T_K),
+    }
+
+
+def eurofer_properties(T_C):
+    """EUROFER electrical conductivity (prop_correlations_EUROFER) in SI units.
+
+    Only ``sigma`` is provided: the module has no EUROFER density or
+    thermal conductivity data.
+    """
+    import prop_correlations_EUROFER as eurofer
+
+    return {"sigma": eurofer.electricalConductivity(_celsius_to_kelvin(T_C))}
+
+
+def _kelvin_range(lower, upper):
+    return (lower - 273.15, upper - 273.15)
+
+
+register(
+    "Pb17Li", "fluid", "materials:pb17li_properties",
+    {
+        "rho": _kelvin_range(508, 880),
+        "mu": _kelvin_range(508, 625),
+        "sigma": _kelvin_range(600, 800),
+        "k": _kelvin_range(508, 873),
+        "beta": _kelvin_range(508, 880),
+        "cp": _kelvin_range(508, 880),
+    },
+    "LM-D-R-262 literature review of PbLi properties, ENEA",
+)
+register(
+    "material_props", "fluid", "material_props:properties",
+    {name: (300.0, 550.0) for name in ("sigma", "rho", "mu", "k", "beta")},
+    "Approximate tabulated PbLi data, linearly interpolated",
+)
+register(
+    "316L", "structural", "materials:ss316l_properties",
+    {
+        "sigma": _kelvin_range(300, 6000),
+        "rho": _kelvin_range(300, 1700),
+        "k": _kelvin_range(300, 1700),
+    },
+    "prop_correlations_316L; rho and k from Kim, ANL-CEN-RSD-75-2 (1975)",
+)
+register(
+    "EUROFER", "structural", "materials:eurofer_properties",
+    {"sigma": _kelvin_range(300, 6000)},
+    "prop_correlations_EUROFER",
+)
@@ -1,3 +1,5 @@
+import inspect
+
 import numpy as np
 
 # Dimensionless numbers
@@ -17,6 +19,11 @@ def grashof_number(g, beta, q, L, k, nu):
     return g * beta * q * L**4 / (k * nu**2)
 
 
+def wall_conductance_ratio(sigma_w, t_w, sigma, L):
+    """Wall conductance ratio ``c_w = sigma_w t_w / (sigma L)``."""
+    return sigma_w * t_w / (sigma * L)
+
+
 # Characteristic length calculations
 
 def length_from_grashof(Gr, g, beta, q_flux, k, nu):
@@ -109,3 +116,176 @@ def heat_flux_from_length(L_gr, B, sigma, rho, nu, g, beta, k, gr_over_ha2):
     num = gr_over_ha2 * k * nu * B**2 * sigma
     den = g * beta * rho * L_gr**2
     return num / den
+
+
+# Exact L_Ha = L_Gr matching ------------------------------------------------
+
+def length_match_heat_flux(U, B, sigma, rho, nu, g, beta, k, ha2_over_re, gr_over_ha2):
+    """Heat flux and length at which ``L_Ha`` and ``L_Gr`` coincide.
+
+    ``L_Ha`` from :func:`characteristic_length_from_Ha_ratio` is linear in
+    ``U`` and ``L_Gr`` from :func:`characteristic_length_from_Gr_ratio`
+    scales with ``q''^(-1/2)``, so both hold simultaneously on the curve
+    ``q''(U) ∝ U^-2``, which is evaluated here in closed form.
+
+    Parameters
+    ----------
+    U : ndarray or float
+        Flow velocity [m/s].
+    B : ndarray or float
+        Magnetic field strength in Tesla.
+    sigma, rho, nu, g, beta, k : ndarray or float
+        Material properties and gravitational acceleration. Arrays broadcast
+        against ``U`` and ``B``, e.g. one value per temperature.
+    ha2_over_re, gr_over_ha2 : float
+        Target interaction parameters.
+
+    Returns
+    -------
+    tuple of ndarray or float
+        Heat flux ``q''`` [W/m^2] and matched length ``L`` [m].
+    """
+    L = characteristic_length_from_Ha_ratio(B, sigma, rho, U, ha2_over_re)
+    q = heat_flux_from_length(L, B, sigma, rho, nu, g, beta, k, gr_over_ha2)
+    return q, L
+
+
+def length_match_velocity(q, B, sigma, rho, nu, g, beta, k, ha2_over_re, gr_over_ha2):
+    """Velocity and length at which ``L_Ha`` and ``L_Gr`` coincide.
+
+    Inverse of :func:`length_match_heat_flux`: for a given heat flux the
+    length follows from the ``Gr/Ha^2`` relation and the velocity from the
+    ``Ha^2/Re`` relation.
+
+    Parameters
+    ----------
+    q : ndarray or float
+        Surface heat flux [W/m^2].
+    B : ndarray or float
+        Magnetic field strength in Tesla.
+    sigma, rho, nu, g, beta, k : ndarray or float
+        Material properties and gravitational acceleration.
+    ha2_over_re, gr_over_ha2 : float
+        Target interaction parameters.
+
+    Returns
+    -------
+    tuple of ndarray or float
+        Velocity ``U`` [m/s] and matched length ``L`` [m].
+    """
+    L = characteristic_length_from_Gr_ratio(B, sigma, rho, nu, g, beta, q, k, gr_over_ha2)
+    U = L * B**2 * sigma / (ha2_over_re * rho)
+    return U, L
+
+
+# Sensitivities ---------------------------------------------------------------
+
+# Every function above is a product of powers of its arguments, so its
+# elasticities d(ln f)/d(ln x) are these constant exponents. Functions that
+# return a tuple have one dict per output. Arguments that cancel out
+# (e.g. ``nu`` in characteristic_length_from_Re_ratio) are omitted.
+EXPONENTS = {
+    "hartmann_number": {"B": 1, "L": 1, "sigma": 0.5, "rho": -0.5, "nu": -0.5},
+    "reynolds_number": {"U": 1, "L": 1, "nu": -1},
+    "grashof_number": {"g": 1, "beta": 1, "q": 1, "L": 4, "k": -1, "nu": -2},
+    "wall_conductance_ratio": {"sigma_w": 1, "t_w": 1, "sigma": -1, "L": -1},
+    "length_from_grashof": {
+        "Gr": 0.25, "g": -0.25, "beta": -0.25, "q_flux": -0.25, "k": 0.25, "nu": 0.5,
+    },
+    "characteristic_length_from_Ha_ratio": {
+        "B": -2, "sigma": -1, "rho": 1, "U": 1, "ha2_over_re": 1,
+    },
+    "characteristic_length_from_Gr_ratio": {
+        "B": 1, "sigma": 0.5, "rho": -0.5, "nu": 0.5, "g": -0.5, "beta": -0.5,
+        "q": -0.5, "k": 0.5, "gr_over_ha2": 0.5,
+    },
+    "characteristic_length_from_Re_ratio": {
+        "B": -2, "sigma": -1, "rho": 1, "U": 1, "ha2_over_re": 1,
+    },
+    "velocity_from_lengths": {
+        "L_ha": 2, "L_re": -1, "B": 2, "sigma": 1, "rho": -1, "ha2_over_re": -1,
+    },
+    "heat_flux_from_length": {
+        "L_gr": -2, "B": 2, "sigma": 1, "rho": -1, "nu": 1, "g": -1, "beta": -1,
+        "k": 1, "gr_over_ha2": 1,
+    },
+    "length_match_heat_flux": (
+        {"U": -2, "B": 6, "sigma": 3, "rho": -3, "nu": 1, "g": -1, "beta": -1,
+         "k": 1, "ha2_over_re": -2, "gr_over_ha2": 1},
+        {"U": 1, "B": -2, "sigma": -1, "rho": 1, "ha2_over_re": 1},
+    ),
+    "length_match_velocity": (
+        {"q": -0.5, "B": 3, "sigma": 1.5, "rho": -1.5, "nu": 0.5, "g": -0.5,
+         "beta": -0.5, "k": 0.5, "ha2_over_re": -1, "gr_over_ha2": 0.5},
+        {"q": -0.5, "B": 1, "sigma": 0.5, "rho": -0.5, "nu": 0.5, "g": -0.5,
+         "beta": -0.5, "k": 0.5, "gr_over_ha2": 0.5},
+    ),
+}
+
+
+def elasticities(func):
+    """Constant elasticities ``d(ln f)/d(ln x)`` of a function in this module."""
+    return EXPONENTS[func.__name__]
+
+
+def value_and_gradient(func, *args, **kwargs):
+    """Evaluate ``func`` together with its partial derivatives.
+
+    The derivatives are analytic: for a power law ``f`` each partial is
+    ``exponent * f / x``, so the whole gradient costs one pass over the grid
+    and broadcasts like the value itself. Where an argument is zero that
+    ratio is ``0/0``, so there the partial is evaluated as
+    ``exponent * x**(exponent - 1) * f(x=1)`` instead (e.g. ``dHa/dB`` at
+    ``B = 0`` is ``Ha`` at ``B = 1``), at the cost of one more call of
+    ``func``.
+
+    Parameters
+    ----------
+    func : callable
+        A function of this module listed in :data:`EXPONENTS`.
+    *args, **kwargs
+        Arguments for ``func``; arrays are broadcast as usual.
+
+    Returns
+    -------
+    tuple
+        ``(value, gradient)`` where ``gradient`` maps argument names to
+        ``df/dx``. For functions returning a tuple, both are tuples.
+    """
+    arguments = inspect.signature(func).bind(*args, **kwargs).arguments
+    value = func(*args, **kwargs)
+    exponents = EXPONENTS[func.__name__]
+    single = not isinstance(value, tuple)
+    if single:
+        value, exponents = (value,), (exponents,)
+
+    def partial(output, name, e):
+        x = np.asarray(arguments[name], dtype=float)
+        zero = x == 0
+        if not zero.any():
+            return e * value[output] / arguments[name]
+        unit = func(**dict(arguments, **{name: 1.0}))
+        unit = unit if single else unit[output]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(zero, e * x ** (e - 1) * unit, e * value[output] / x)
+
+    gradient = tuple({name: partial(i, name, e) for name, e in exponents[i].items()}
+                     for i in range(len(value)))
+    if single:
+        return value[0], gradient[0]
+    return value, gradient
+
+
+def temperature_derivative(gradient, property_derivatives):
+    """Chain rule ``df/dT = sum_p df/dp * dp/dT`` over material properties.
+
+    Parameters
+    ----------
+    gradient : dict
+        Partial derivatives from :func:`value_and_gradient`.
+    property_derivatives : dict
+        ``dp/dT`` per property, e.g. from
+        :func:`property_state.property_derivatives`.
+    """
+    return sum(gradient[name] * dp for name, dp in property_derivatives.items()
+               if name in gradient)
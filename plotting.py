@@ -10,7 +10,8 @@ def plot_Lha_Lgr_q(L_ha, L_gr, q_values, title="L_Ha vs L_Gr vs heat flux"):
     grids. When vectors are provided a mesh grid is created internally.  If the
     inputs are already 2D and share the same shape as ``q_values`` they are used
     directly.  This prevents broadcasting errors when the caller has already
-    generated the grids.
+    generated the grids.  ``q_values`` may be anything that broadcasts to the
+    grid, such as a :class:`lazy_grid.FactoredGrid` of shape ``(len(L_gr), 1)``.
     """
 
     fig = plt.figure()
@@ -22,7 +23,8 @@ def plot_Lha_Lgr_q(L_ha, L_gr, q_values, title="L_Ha vs L_Gr vs heat flux"):
         # assume arrays are already shaped correctly
         X, Y = L_ha, L_gr
 
-    Z = q_values
+    # Broadcast, so a map constant along L_Ha or a FactoredGrid is accepted
+    Z = np.broadcast_to(q_values, X.shape)
 
     surf = ax.plot_surface(X, Y, Z, cmap="viridis", alpha=0.8)
     ax.set_xlabel("L_Ha [m]")
@@ -48,7 +50,7 @@ def plot_Lha_Lre_u(L_ha, L_re, u_values, title="L_Ha vs L_Re vs velocity"):
     else:
         X, Y = L_ha, L_re
 
-    Z = u_values
+    Z = np.broadcast_to(u_values, X.shape)
 
     surf = ax.plot_surface(X, Y, Z, cmap="plasma", alpha=0.8)
     ax.set_xlabel("L_Ha [m]")
@@ -58,7 +60,8 @@ def plot_Lha_Lre_u(L_ha, L_re, u_values, title="L_Ha vs L_Re vs velocity"):
     fig.colorbar(surf, shrink=0.5, aspect=5)
     return fig, ax
 
-def plot_length_match(U, q, L, diff, threshold=1e-3, title="Characteristic length match"):
+def plot_length_match(U, q, L, diff, threshold=1e-3, title="Characteristic length match",
+                      match=None):
     """Contour plot of characteristic length with match indication.
 
     Parameters
@@ -75,13 +78,131 @@ def plot_length_match(U, q, L, diff, threshold=1e-3, title="Characteristic lengt
         Contour level used to highlight where ``|L_Ha - L_Gr|`` is small.
     title : str, optional
         Plot title.
+    match : tuple of ndarray, optional
+        ``(U, q)`` points of the exact ``L_Ha = L_Gr`` curve, e.g. from
+        :func:`mhd_scaling.length_match_heat_flux` with ``q`` in MW/m^2. When
+        given it is drawn instead of the ``threshold`` contour.
     """
     fig, ax = plt.subplots()
     cf = ax.contourf(U, q, L, cmap="viridis")
     cbar = fig.colorbar(cf, ax=ax)
     cbar.set_label("L [m]")
-    ax.contour(U, q, np.abs(diff), levels=[threshold], colors="r")
+    if match is None:
+        ax.contour(U, q, np.abs(diff), levels=[threshold], colors="r")
+    else:
+        ax.plot(*match, color="r", label="L_Ha = L_Gr")
+        ax.set_xlim(np.min(U), np.max(U))
+        ax.set_ylim(np.min(q), np.max(q))
     ax.set_xlabel("U [m/s]")
     ax.set_ylabel("q'' [MW/m^2]")
     ax.set_title(title)
     return fig, ax
+
+
+def density_grid(x, y, bins=200, range=None, log=True):
+    """Bin a point cloud into a 2D histogram in one vectorised pass.
+
+    Parameters
+    ----------
+    x, y : array_like
+        Point coordinates; non-finite (or, with ``log``, non-positive)
+        points are skipped.
+    bins : int or (int, int), optional
+        Number of bins per axis.
+    range : ((float, float), (float, float)), optional
+        Bin range per axis, in decades when ``log`` is set. Defaults to the
+        extent of the data.
+    log : bool, optional
+        Bin ``log10`` of the coordinates.
+
+    Returns
+    -------
+    tuple
+        ``(counts, x_edges, y_edges)`` as from :func:`numpy.histogram2d`,
+        with the edges in decades when ``log`` is set. The same form as
+        :class:`design_space.HistogramReducer` results, so streamed sweeps
+        can be drawn with :func:`plot_density` without holding the points.
+    """
+    x = np.asarray(x, dtype=float).ravel()
+    y = np.asarray(y, dtype=float).ravel()
+    if log:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x, y = np.log10(x), np.log10(y)
+    finite = np.isfinite(x) & np.isfinite(y)
+    x, y = x[finite], y[finite]
+
+    # Uniform bins: compute bin indices directly and count them with one
+    # bincount, which is much cheaper than the generic histogram2d search
+    bins = np.broadcast_to(bins, 2)
+    if range is None:
+        range = [(v.min(), v.max()) if v.size else (0.0, 1.0) for v in (x, y)]
+    edges, index, inside = [], [], np.ones(x.size, dtype=bool)
+    for v, n, (lo, hi) in zip((x, y), bins, range):
+        if hi <= lo:
+            lo, hi = lo - 0.5, hi + 0.5
+        i = np.floor((v - lo) * (n / (hi - lo))).astype(np.intp)
+        i[v == hi] = n - 1  # right edge belongs to the last bin
+        inside &= (i >= 0) & (i < n)
+        edges.append(np.linspace(lo, hi, n + 1))
+        index.append(i)
+    flat = index[0][inside] * bins[1] + index[1][inside]
+    counts = np.bincount(flat, minlength=bins[0] * bins[1]).reshape(bins)
+    return counts.astype(float), edges[0], edges[1]
+
+
+def plot_density(counts, x_edges, y_edges, envelope=None, log=True,
+                 title="Experimental Capability Envelope: Ha²/Re vs Gr (Log-Log Scale)",
+                 xlabel="Grashof Number (Gr)", ylabel="Ha² / Re", cmap="viridis"):
+    """Draw binned design points as a raster, optionally with their envelope.
+
+    The figure holds one raster cell per bin whatever the number of points
+    binned, so drawing time and file size do not grow with the sweep.
+
+    Parameters
+    ----------
+    counts : ndarray
+        ``(nx, ny)`` point counts, e.g. from :func:`density_grid`.
+    x_edges, y_edges : ndarray
+        Bin edges, in decades when ``log`` is set.
+    envelope : ndarray, optional
+        ``(N, 2)`` closed polygon in data coordinates, e.g. from
+        :meth:`envelope.IncrementalHull.result`.
+    log : bool, optional
+        The edges are in decades; the axes are drawn on log scales.
+    title, xlabel, ylabel : str, optional
+        Plot labels.
+    cmap : str, optional
+        Colour map of the point counts.
+    """
+    from matplotlib.colors import LogNorm
+
+    if log:
+        x_edges, y_edges = 10**np.asarray(x_edges), 10**np.asarray(y_edges)
+    counts = np.ma.masked_less_equal(np.asarray(counts).T, 0)
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    mesh = ax.pcolormesh(x_edges, y_edges, counts, cmap=cmap, rasterized=True,
+                         norm=LogNorm() if counts.count() else None)
+    fig.colorbar(mesh, ax=ax, label="Design points per bin")
+    if envelope is not None:
+        ax.plot(envelope[:, 0], envelope[:, 1], color="#C00000", lw=2, label="Envelope")
+        ax.legend(loc="upper left")  # "best" would search the whole raster
+    if log:
+        ax.set_xscale("log")
+        ax.set_yscale("log")
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    ax.grid(True, which="both", linestyle="--", linewidth=0.5)
+    fig.tight_layout()
+    return fig, ax
+
+
+def plot_capability_density(Gr, ha2_over_re, envelope=None, bins=200, range=None, **kwargs):
+    """Density-rasterised Ha²/Re vs Gr capability plot.
+
+    Replaces a scatter of every design point by :func:`density_grid` and
+    :func:`plot_density`; ``kwargs`` are passed on to the latter.
+    """
+    counts, x_edges, y_edges = density_grid(Gr, ha2_over_re, bins=bins, range=range)
+    return plot_density(counts, x_edges, y_edges, envelope=envelope, **kwargs)
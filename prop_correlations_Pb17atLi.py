@@ -22,16 +22,65 @@ Reference: LM-D-R-262 - Literature review of PbLi properties,
 ENEA [27/04/2107] - IDM
 
 Notes:
-    1. Add logging to flag warnings when required temperture is out of the 
-    correlation range. Then allow return of values, but with extrapolation
-    warning.
+    1. Every correlation accepts a scalar or a NumPy array of temperatures
+    and is evaluated element-wise in a single pass.
+    2. Temperatures outside the correlation range are handled per element
+    according to the outOfRange argument:
+        "raise"  - raise a ValueError if any element is out of range
+        "warn"   - return extrapolated values with a RuntimeWarning
+        "clip"   - clip out of range elements to the nearest range limit
+        "nan"    - return NaN for out of range elements
+        "ignore" - return extrapolated values silently
+    The defaults keep the historic behaviour: correlations that used to
+    assert their range default to "raise", the others to "ignore".
 """
-import math
-from scipy import constants as const
+import warnings
 
+import numpy as np
 
+# Physical constants, as in scipy.constants; kept here so that importing the
+# correlations does not pull in scipy
+zero_Celsius = 273.15     # K
+R = 8.31446261815324      # molar gas constant, J/mol.K
 
-def density(tempK):
+
+OUT_OF_RANGE_MODES = ("raise", "warn", "clip", "nan", "ignore")
+
+
+def checkRange(temp, lower, upper, name, outOfRange="raise"):
+    """ Applies the outOfRange policy to an array of temperatures.
+    Params.:
+        temp float or ndarray: temperatures to check
+        lower, upper float: validity range of the correlation, inclusive
+        name str: property name used in the warning/error message
+        outOfRange str: one of OUT_OF_RANGE_MODES
+    Returns:
+        temp ndarray: temperatures to evaluate the correlation at, with out
+        of range elements clipped or set to NaN when requested.
+    """
+    if outOfRange not in OUT_OF_RANGE_MODES:
+        raise ValueError(f"outOfRange must be one of {OUT_OF_RANGE_MODES}, "
+                         f"got {outOfRange!r}")
+    temp = np.asarray(temp, dtype=float)
+    if outOfRange == "ignore":
+        return temp
+    outside = (temp < lower) | (temp > upper)
+    if not outside.any():
+        return temp
+    message = (f"Input temperature for {name} is out of range "
+               f"({lower} <= T <= {upper}) for {np.count_nonzero(outside)} "
+               f"of {outside.size} values")
+    if outOfRange == "raise":
+        raise ValueError(message)
+    if outOfRange == "warn":
+        warnings.warn(message, RuntimeWarning, stacklevel=3)
+        return temp
+    if outOfRange == "clip":
+        return np.clip(temp, lower, upper)
+    return np.where(outside, np.nan, temp)
+
+
+def density(tempK, outOfRange="ignore"):
     """ Returns the density of Pb %at.17 Li for a given temperature
     in degrees Kelvin. Correlation has 0.3% error and 4.39% scattering.
     Valid for temperature within the 508 - 880 K range.
@@ -40,16 +89,16 @@ def density(tempK):
     Ref.:
         1. As above
     Params.:
-        tempK [K] float: temperature at which density is required
+        tempK [K] float or ndarray: temperature at which density is required
+        outOfRange str: out of range policy, see module notes
     Returns:
-        density [kg/m^3] float: temperature dependant density for
+        density [kg/m^3] float or ndarray: temperature dependant density for
         Pb 17.0at.% Li.
     """
-    #assert tempK >= 508 and tempK <= 880, "Input temperature for density is \
-    #                                        out of range (508 <= T <= 880 K)"
+    tempK = checkRange(tempK, 508, 880, "density", outOfRange)
     return 10520.35 - (1.19051 * tempK)
 
-def specificHeat(tempK):
+def specificHeat(tempK, outOfRange="raise"):
     """ Returns the specific heat capacity Cp for Pb 16.8at.% Li for a given
     temperature in degrees Kelvin. Correlation has an +/- 3% error and a 
     31.39% scattering. It is valid for the temperatures within the 
@@ -59,17 +108,18 @@ def specificHeat(tempK):
     Ref.:
         1. As above
     Params.:
-        tempK [K] float: temperature at which specific heat capacity is required
+        tempK [K] float or ndarray: temperature at which specific heat
+        capacity is required
+        outOfRange str: out of range policy, see module notes
     Returns:
-        specficHeatCapacity [J/(g.K)] float: temperature dependant specific 
-        heat capacity
+        specficHeatCapacity [J/(g.K)] float or ndarray: temperature dependant
+        specific heat capacity
     """
-    assert tempK >= 508 and tempK <= 880, f"Input temperature for Specific Heat\
-                                             capacity, C_p is out of range \
-                                             (508 <= T <= 880 K). T={tempK} K"
+    tempK = checkRange(tempK, 508, 880, "Specific Heat capacity, C_p",
+                       outOfRange)
     return 0.195 - (tempK * 9.116E-06)
 
-def thermalDiffusivity(tempK):
+def thermalDiffusivity(tempK, outOfRange="raise"):
     """ Returns the thermal diffusivity, alpha, for Pb 17.0at.% Li for a given
     temperature in degrees Kelvin. Correlation has an error <=5E-03 cm^2/s and\
     a 37.35% scattering. It is valid for the temperatures within the 
@@ -79,17 +129,18 @@ def thermalDiffusivity(tempK):
     Ref.:
         1. As above
     Params.:
-        tempK [K] float: temperature at which thermal diffusivity is required
+        tempK [K] float or ndarray: temperature at which thermal diffusivity
+        is required
+        outOfRange str: out of range policy, see module notes
     Returns:
-        thermalDiffusivity [cm^2/s] float: temperature dependant thermal 
-        diffusivity
+        thermalDiffusivity [cm^2/s] float or ndarray: temperature dependant
+        thermal diffusivity
     """
-    assert tempK >= 508 and tempK <= 773, "Input temperature for thermal\
-                                             diffusivity, alpha is out of range \
-                                             (508 <= T <= 773 K)"
+    tempK = checkRange(tempK, 508, 773, "thermal diffusivity, alpha",
+                       outOfRange)
     return tempK * 3.46E-04 - 1.05E-01
 
-def thermalConductivity(tempC):
+def thermalConductivity(tempC, outOfRange="ignore"):
     """ Returns the thermal conductivity, lambda, for Pb 17.0at.% Li for a 
     given temperature in degrees Celsius. Correlation has an 37.72% scattering.
     It is valid for the temperatures within the range 505 - 873 K.
@@ -98,39 +149,56 @@ def thermalConductivity(tempC):
     Ref.:
         1. As above
     Params.:
-        tempC [C] float: temperature at which thermal conductivity is required
+        tempC [C] float or ndarray: temperature at which thermal conductivity
+        is required
+        outOfRange str: out of range policy, see module notes
     Returns:
-        thermalConductivity [W/cm.K] float: temperature dependant thermal 
-        conductivity
+        thermalConductivity [W/cm.K] float or ndarray: temperature dependant
+        thermal conductivity
     """
-    #assert tempC >= 508 and tempC <= 873, "Input temperature for thermal conductivity, lambda is out of range 508 <= T <= 873 K)"
+    tempC = checkRange(tempC, 508 - zero_Celsius,
+                       873 - zero_Celsius,
+                       "thermal conductivity, lambda", outOfRange)
     return 0.1451 + (tempC * 1.9631E-04)
 
-def dynamicViscosity(tempK):
+def dynamicViscosity(tempK, outOfRange="ignore"):
     """ Returns the dynamic viscosity, mew, for Pb 16.8at.% Li for a 
     given temperature in degrees Kelvin. Correlation has an 14.75% scattering.
     It is valid for the temperatures within the range 508 - 625 K.
     Dependancies:
-        1. math
-        2. scypy.constants
+        1. numpy
+        2. R (molar gas constant)
     Notes:
         1. NA
     Ref.:
         1. As above
     Params.:
-        tempK [K] float: temperature at which Dynamic Viscosity is required
+        tempK [K] float or ndarray: temperature at which Dynamic Viscosity is
+        required
+        outOfRange str: out of range policy, see module notes
     Returns:
-        dynamicViscosity [mPa.s] float: temperature dependant dynamic viscosity
+        dynamicViscosity [mPa.s] float or ndarray: temperature dependant
+        dynamic viscosity
     """
-    #assert tempK >= 508 and tempK <= 625, "Input temperature for Dynamic \
-    #                                        Viscosity, mew is out \
-    #                                        of range 508 <= T <= 625 K"
-    return 0.187 * math.exp(11640 / (const.R * tempK)) * 1E-03
+    tempK = checkRange(tempK, 508, 625, "Dynamic Viscosity, mew", outOfRange)
+    return 0.187 * np.exp(11640 / (R * tempK)) * 1E-03
 
-def kinematicViscosity(tempK):
+def kinematicViscosity(tempK, outOfRange="ignore"):
+    """ Returns the kinematic viscosity, nu, for Pb 17.0at.% Li as the ratio
+    of dynamicViscosity and density. The range check is applied once, so both
+    correlations see the same (possibly clipped) temperatures.
+    Params.:
+        tempK [K] float or ndarray: temperature at which Kinematic Viscosity
+        is required
+        outOfRange str: out of range policy, see module notes
+    Returns:
+        kinematicViscosity [m^2/s] float or ndarray: temperature dependant
+        kinematic viscosity
+    """
+    tempK = checkRange(tempK, 508, 625, "Kinematic Viscosity, nu", outOfRange)
     return dynamicViscosity(tempK) / density(tempK)
 
-def volumetricThermalExpansionCoeff(tempK):
+def volumetricThermalExpansionCoeff(tempK, outOfRange="raise"):
     """ Returns the Volumetric Thermal Expansion Coefficient, beta, for 
     Pb 17.0at.% Li for a given temperature in degrees Kelvin. Correlation has 
     an 3% error and a 49.41% scattering. It is valid for the temperatures 
@@ -142,16 +210,19 @@ def volumetricThermalExpansionCoeff(tempK):
     Ref.:
         1. As above
     Params.:
-        tempK [K] float: temperature at which Volumetric Thermal Expansion 
-        Coefficient is required
+        tempK [K] float or ndarray: temperature at which Volumetric Thermal
+        Expansion Coefficient is required
+        outOfRange str: out of range policy, see module notes
     Returns:
-        volumetricThermalExpansionCoeff [1/K] float: temperature dependant 
-        Volumetric Thermal Expanison Coefficient
+        volumetricThermalExpansionCoeff [1/K] float or ndarray: temperature
+        dependant Volumetric Thermal Expanison Coefficient
     """
-    assert tempK >= 508 and tempK <= 880, "Input temperature for Volumetric Thermal Expansion Coefficient, beta, is out of range 508 <= T <= 880 K"
+    tempK = checkRange(tempK, 508, 880,
+                       "Volumetric Thermal Expansion Coefficient, beta,",
+                       outOfRange)
     return (11.221 + (tempK * 1.531E-03)) * 1E-05
 
-def surfaceTension(tempK):
+def surfaceTension(tempK, outOfRange="raise"):
     """ Returns the Surface Tension, sigma, for Pb 17.0at.% Li for a given 
     temperature in degrees Kelvin. Correlation has an 2% error and a 15.08% 
     scattering. It is valid for the temperatures within the range 508 - 700 K.
@@ -162,56 +233,75 @@ def surfaceTension(tempK):
     Ref.:
         1. As above
     Params.:
-        tempK [K] float: temperature at which the Surface Tension is required
+        tempK [K] float or ndarray: temperature at which the Surface Tension
+        is required
+        outOfRange str: out of range policy, see module notes
     Returns:
-        surfaceTension [mN/m] float: temperature dependant Surface Tension
+        surfaceTension [mN/m] float or ndarray: temperature dependant Surface
+        Tension
     """
-    assert tempK >= 508 and tempK <= 700, "Input temperature for Surface Tension, sigma, is out of range 508 <= T <= 700 K"
+    tempK = checkRange(tempK, 508, 700, "Surface Tension, sigma,", outOfRange)
     return 459.4 - (0.04 * (tempK - 518))
 
-def electricalResistivity(tempK):
+def electricalResistivity(tempK, outOfRange="ignore"):
     """ Returns the Electrical Resistivity, rho_el, for Pb 17.0at.% Li for a 
     given temperature in degrees Kelvin. Correlation has a 11.83% scattering. 
     It is valid for the temperatures within the range 600 - 800 K.
     Dependancies:
-        1. math
+        1. NA
     Notes:
         1. NA
     Ref.:
         1. As above
     Params.:
-        tempK [K] float: temperature at which the Electrical Resistivity is 
-        required
+        tempK [K] float or ndarray: temperature at which the Electrical
+        Resistivity is required
+        outOfRange str: out of range policy, see module notes
     Returns:
-        electricalResistivty [ohm/m] float: temperature dependant Electrical
-        Resistivity.
+        electricalResistivty [ohm/m] float or ndarray: temperature dependant
+        Electrical Resistivity.
     """
-    #assert tempK >= 600 and tempK <= 800, "Input temperature for Electrical Resistivity correlation is out of range 600 <= T <= 800 K"
-    return 103.33E-08 - (tempK * 6.750E-11) + (math.pow(tempK, 2) * 4.180E-13)
+    tempK = checkRange(tempK, 600, 800, "Electrical Resistivity correlation",
+                       outOfRange)
+    return 103.33E-08 - (tempK * 6.750E-11) + (tempK**2 * 4.180E-13)
 
-def electricalConductivity(tempK):
-    return 1 / electricalResistivity(tempK)
+def electricalConductivity(tempK, outOfRange="ignore"):
+    """ Returns the Electrical Conductivity, sigma_el, for Pb 17.0at.% Li as
+    the reciprocal of electricalResistivity.
+    Params.:
+        tempK [K] float or ndarray: temperature at which the Electrical
+        Conductivity is required
+        outOfRange str: out of range policy, see module notes
+    Returns:
+        electricalConductivity [S/m] float or ndarray: temperature dependant
+        Electrical Conductivity.
+    """
+    return 1 / electricalResistivity(tempK, outOfRange)
 
-def vapourPressure(tempC):
+def vapourPressure(tempC, outOfRange="raise"):
     """ Returns the Vapour Pressure, P_V, for Pb 17.0at.% Li for a given 
     temperature in degrees Celsuis. Correlation has no recorded error or 
     scattering data. It is valid for the temperatures within the 
     range 508 - 873 K.
     Dependancies:
-        1. math
+        1. numpy
     Notes:
         1. NA
     Ref.:
         1. As above
     Params.:
-        tempC [C] float: temperature at which the Vapour Pressure is required
+        tempC [C] float or ndarray: temperature at which the Vapour Pressure
+        is required
+        outOfRange str: out of range policy, see module notes
     Returns:
-        vapourPressure [mbar] float: temperature dependant Vapour Pressure
+        vapourPressure [mbar] float or ndarray: temperature dependant Vapour
+        Pressure
     """
-    assert tempC >= 508 and tempC <= 873, "Input temperature for Vapour Pressure correlation is out of range 508 <= T <= 873 K"
-    return math.pow(tempC, 20.025) * 1.4508E-59
+    tempC = checkRange(tempC, 508, 873, "Vapour Pressure correlation",
+                       outOfRange)
+    return np.power(tempC, 20.025) * 1.4508E-59
 
-def speedOfSound(tempC):
+def speedOfSound(tempC, outOfRange="raise"):
     """ Returns the Speed of Sound, c, for Pb 17.0at.% Li for a given 
     temperature in degrees Celsuis. Correlation has a reported error 
     of +/- 7 m/s. It is valid for the temperatures within the 
@@ -223,10 +313,13 @@ def speedOfSound(tempC):
     Ref.:
         1. As above
     Params.:
-        tempC [C] float: temperature at which the Speed of Sound is required
+        tempC [C] float or ndarray: temperature at which the Speed of Sound
+        is required
+        outOfRange str: out of range policy, see module notes
     Returns:
-        speedOfSound [m/s] float: temperature dependant Speed of Sound
+        speedOfSound [m/s] float or ndarray: temperature dependant Speed of
+        Sound
     """
-    assert tempC >= 513 and tempC <= 783, "Input temperature for Speed of Sound correlation is out of range 513 <= T <= 783 K"
+    tempC = checkRange(tempC, 513, 783, "Speed of Sound correlation",
+                       outOfRange)
     return 1876 - (0.306 * tempC)
-    
\ No newline at end of file
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Mar 17 17:11:58 2021
+
+@author: david
+
+Correlations shared by the structural material modules
+(prop_correlations_316L.py, prop_correlations_EUROFER.py), which only differ
+in their electricalConductivity. The data are those of the original modules
+(melting point T_melt = 3695 K, molar mass W_M = 183.84 g/mol, 19250 kg/m^3),
+i.e. tungsten, not steel: the materials registry does not use density or
+thermalConductivity from here, and prop_correlations_316L overrides both.
+
+All functions accept a scalar or a NumPy array of temperatures.
+"""
+
+import warnings
+
+import numpy as np
+
+extrapolation = True # set this True to bypass the assert statements
+
+T_melt = 3695 # K
+dH_f = 52.3 # kJ/mol
+W_M = 183.84 # g/mol
+
+
+def _checkRange(tempK, lower, upper=np.inf):
+    tempK = np.asarray(tempK, dtype=float)
+    if extrapolation == False:
+        assert np.all((tempK >= lower) & (tempK <= upper)), f'Input temperature is out of range {lower} <= T <= {upper} K'
+    return tempK
+
+def _select(tempK, condlist, choicelist):
+    """ Piecewise correlation; unmatched temperatures return 0 with a
+    warning, as the scalar versions did.
+    """
+    unmatched = ~np.logical_or.reduce(condlist)
+    if np.any(unmatched):
+        warnings.warn(f'Something went wrong! T = {tempK[unmatched]}', RuntimeWarning, stacklevel=3)
+    return np.select(condlist, choicelist, default=0.0)
+
+
+def specificHeatCapacity(tempK):
+    """ Currently J/mol.K
+    """
+    tempK = _checkRange(tempK, 300)
+    return _select(tempK,
+        [tempK <= 3080, (tempK > 3080) & (tempK <= 3695), tempK > 3695],
+        [(1 / W_M*1E+03) * 21.868372 + (8.068661 * 1E-03 * tempK) - (3.756196 * 1E-06 *
+                           tempK**2) + (1.075862 * 1E-09 *
+                                   tempK**3) + (1.406637 * 1E+04 /
+                                           tempK**2),
+         (1 / W_M*1E+03) * 2.022 + (1.315E-02 * tempK),
+         np.full_like(tempK, (1 / W_M*1E+03) * 51.3)])
+
+def thermalConductivity(tempK):
+    """ W/m.K
+    """
+    tempK = _checkRange(tempK, 300, 6000)
+    return _select(tempK,
+        [tempK <= 3695, (tempK > 3695) & (tempK <= 6000)],
+        [149.441 - (45.466E-03 * tempK) + (13.193E-06 *
+                         tempK**2) - (1.484E-09 *
+                                 tempK**3) + (3.866E+06 /
+                                         tempK**2),
+         66.6212 + (0.02086 * (tempK - T_melt)) - (3.7585E-06 *
+                         (tempK - T_melt)**2)])
+
+def density(tempK):
+    """ g/cm^3 * by 1000 for kg/m^3
+    """
+    T_0 = 293.15 # K
+    tempK = _checkRange(tempK, 300, 6000)
+    return _select(tempK,
+        [tempK <= 3695, (tempK > 3695) & (tempK <= 6000)],
+        [1E+03 *19.25 - (2.66207E-04 * (tempK - T_0)) - (3.0595E-09 *
+                       (tempK - T_0)**2) - (9.5185E-12 *
+                               (tempK - T_0)**3),
+         1E+03 * 16.267 - (7.679E-04 * (tempK - T_melt)) - (8.091E-08 *
+                        (tempK - T_melt)**2)])
+
+def electricalResistivity(tempK):
+    """
+    Parameters
+    ----------
+    tempK : float or ndarray
+        Temperature [K].
+
+    Returns
+    -------
+    electricalResistivity : float or ndarray
+        Electrical resistivity [ohm.m].
+    """
+    tempK = np.asarray(tempK, dtype=float)
+    return 1E-08 * (-0.9680 +1.9274E-02 * tempK + 7.8260E-06 * tempK**2 - 1.8517E-09 * tempK**3 + 2.0790E-13 * tempK**4)
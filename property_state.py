@@ -0,0 +1,89 @@
+from dataclasses import dataclass, fields
+from functools import lru_cache
+
+import numpy as np
+
+import materials
+
+# Maximum number of (material, temperature) property sets kept in memory
+CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class PropertyState:
+    """Evaluated fluid properties for one material at one temperature (SI)."""
+
+    material: str
+    T_C: float
+    sigma: float  # electrical conductivity [S/m]
+    rho: float    # density [kg/m^3]
+    mu: float     # dynamic viscosity [Pa*s]
+    nu: float     # kinematic viscosity [m^2/s]
+    k: float      # thermal conductivity [W/m/K]
+    beta: float   # volumetric thermal expansion coefficient [1/K]
+
+
+PROPERTY_NAMES = tuple(f.name for f in fields(PropertyState))[2:]
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _cached_state(material, T_C):
+    props = materials.get(material).properties(T_C)
+    return PropertyState(material, T_C, **{name: float(props[name]) for name in PROPERTY_NAMES})
+
+
+def property_state(material, T_C):
+    """Memoised :class:`PropertyState` for ``material`` at ``T_C`` [C].
+
+    Every correlation is evaluated once per (material, temperature); later
+    calls return the cached state from a bounded LRU cache.
+
+    Parameters
+    ----------
+    material : str
+        Name of a fluid in the :mod:`materials` registry.
+    T_C : float
+        Temperature in Celsius.
+    """
+    if materials.get(material).kind != "fluid":
+        raise ValueError(f"property states are only defined for fluids, not {material!r}")
+    return _cached_state(material, float(T_C))
+
+
+def property_arrays(material, T_C):
+    """Properties for an array of temperatures, reusing cached states.
+
+    Returns
+    -------
+    dict
+        ``{name: ndarray}`` for every name in :data:`PROPERTY_NAMES`, with the
+        shape of ``T_C``.
+    """
+    T_C = np.asarray(T_C, dtype=float)
+    states = [property_state(material, T) for T in T_C.ravel()]
+    return {
+        name: np.array([getattr(s, name) for s in states]).reshape(T_C.shape)
+        for name in PROPERTY_NAMES
+    }
+
+
+def property_derivatives(material, T_C, dT=0.5):
+    """Temperature derivatives ``dp/dT`` [per K] of every property.
+
+    Central differences of the vectorised property evaluators, so one call
+    covers a whole array of temperatures.
+    """
+    T_C = np.asarray(T_C, dtype=float)
+    evaluate = materials.get(material).properties
+    upper, lower = evaluate(T_C + dT), evaluate(T_C - dT)
+    return {name: (upper[name] - lower[name]) / (2 * dT) for name in upper}
+
+
+def cache_info():
+    """Hit/miss statistics of the property-state cache."""
+    return _cached_state.cache_info()
+
+
+def clear_cache():
+    """Drop every cached property state, e.g. after editing a correlation."""
+    _cached_state.cache_clear()
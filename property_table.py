@@ -0,0 +1,71 @@
+from bisect import bisect_right
+
+import numpy as np
+
+
+class PropertyTable:
+    """Several material properties tabulated on one temperature grid.
+
+    All properties share the same knots, so evaluating any number of them
+    for an array of temperatures costs a single ``searchsorted`` bracket
+    plus one linear blend. Temperatures outside the table are linearly
+    extrapolated from the end intervals, like
+    ``interp1d(..., fill_value="extrapolate")``.
+
+    Parameters
+    ----------
+    T : array_like
+        Strictly increasing temperature knots (at least two).
+    **columns : array_like
+        Property values at the knots, one keyword per property.
+    """
+
+    def __init__(self, T, **columns):
+        self.T = np.asarray(T, dtype=float)
+        if self.T.ndim != 1 or self.T.size < 2 or np.any(np.diff(self.T) <= 0):
+            raise ValueError("T must be a strictly increasing 1D array of at least two knots")
+        self.names = tuple(columns)
+        self.values = np.vstack([np.asarray(columns[name], dtype=float) for name in self.names])
+        if self.values.shape[1] != self.T.size:
+            raise ValueError("every property needs one value per temperature knot")
+        self._slopes = np.diff(self.values, axis=1) / np.diff(self.T)
+        # Plain Python copies for scalar(), which avoids NumPy call overhead
+        self._knots = self.T.tolist()
+        self._scalar_rows = {
+            name: (values.tolist(), slopes.tolist())
+            for name, values, slopes in zip(self.names, self.values, self._slopes)
+        }
+
+    def __call__(self, T, names=None):
+        """Evaluate properties at temperatures ``T``.
+
+        Parameters
+        ----------
+        T : array_like or float
+            Temperatures, in the units of the knots. Any shape.
+        names : sequence of str, optional
+            Properties to evaluate; all of them by default.
+
+        Returns
+        -------
+        dict
+            ``{name: ndarray}`` with the shape of ``T``.
+        """
+        T = np.asarray(T, dtype=float)
+        names = self.names if names is None else tuple(names)
+        rows = [self.names.index(name) for name in names]
+        i = np.clip(np.searchsorted(self.T, T, side="right") - 1, 0, self.T.size - 2)
+        dT = T - self.T[i]
+        blended = self.values[rows][:, i] + self._slopes[rows][:, i] * dT
+        return dict(zip(names, blended))
+
+    def scalar(self, T, name):
+        """One property at one temperature, as a float.
+
+        Same interpolation and extrapolation as :meth:`__call__`, in plain
+        Python: much cheaper than the array path for a single lookup.
+        """
+        values, slopes = self._scalar_rows[name]
+        knots = self._knots
+        i = min(max(bisect_right(knots, T) - 1, 0), len(knots) - 2)
+        return values[i] + slopes[i] * (T - knots[i])
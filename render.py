@@ -0,0 +1,187 @@
+"""Headless batch rendering of the study figures.
+
+Figures are described as :class:`FigureJob` objects and rendered with the
+non-interactive Agg backend, optionally in a process pool. Every figure is
+closed as soon as it is saved, so long batches do not accumulate memory::
+
+    python render.py --workers 4 --out report
+
+writes the ``length_match_<T>C.png`` report for every temperature.
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+
+import mhd_scaling as mhd
+from design_query import DEMO_TARGETS
+from instrumentation import stage
+from property_state import property_state
+
+G = 9.81  # m/s^2
+
+# Temperatures of the length-match report [C]
+REPORT_TEMPERATURES = np.arange(300, 551, 25)
+
+
+def use_headless():
+    """Switch matplotlib to the non-interactive Agg backend."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+@dataclass
+class FigureJob:
+    """One figure to render: ``func(*args, **kwargs)`` saved to ``path``.
+
+    ``func`` must be defined at module level so the job can be sent to a
+    worker process, and return a figure or a ``(fig, ax)`` tuple like the
+    functions in :mod:`plotting`.
+    """
+
+    path: str
+    func: callable
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+    savefig: dict = field(default_factory=dict)
+
+
+def render_job(job):
+    """Render, save and close the figure of ``job``; returns its path."""
+    with stage("plot"):
+        import matplotlib.pyplot as plt
+
+        result = job.func(*job.args, **job.kwargs)
+        fig = result[0] if isinstance(result, tuple) else result
+        try:
+            fig.savefig(job.path, **job.savefig)
+        finally:
+            plt.close(fig)
+    return job.path
+
+
+def render_jobs(jobs, workers=1):
+    """Render every job, in a process pool of Agg workers if ``workers > 1``.
+
+    With ``workers=1`` the jobs are rendered in the calling process with its
+    current backend; call :func:`use_headless` first for a headless run.
+
+    Returns
+    -------
+    list of str
+        Paths of the saved figures, in the order of ``jobs``.
+    """
+    jobs = list(jobs)
+    for directory in {os.path.dirname(job.path) for job in jobs}:
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    if workers <= 1 or len(jobs) <= 1:
+        return [render_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers, initializer=use_headless) as pool:
+        return list(pool.map(render_job, jobs))
+
+
+def show_or_save(fig, path=None, **savefig_kwargs):
+    """Save and close ``fig`` if ``path`` is given, otherwise show it."""
+    import matplotlib.pyplot as plt
+
+    if path is None:
+        plt.show()
+        return None
+    fig.savefig(path, **savefig_kwargs)
+    plt.close(fig)
+    return path
+
+
+def show_image(path):
+    """Show a saved figure file, e.g. one read back from a cache."""
+    import matplotlib.pyplot as plt
+
+    image = plt.imread(path)
+    height, width = image.shape[:2]
+    fig = plt.figure(figsize=(width / 100, height / 100), dpi=100)
+    ax = fig.add_axes((0, 0, 1, 1))
+    ax.imshow(image)
+    ax.set_axis_off()
+    return show_or_save(fig)
+
+
+# Length-match report -------------------------------------------------------
+
+def length_match_figure(T_C, material="material_props", B=4.0, U=None, q=None, g=G,
+                        ha2_over_re=DEMO_TARGETS["I_ha2_over_re"],
+                        gr_over_ha2=DEMO_TARGETS["I_gr_over_ha2"], n=50):
+    """:func:`plotting.plot_length_match` for one operating temperature.
+
+    Parameters
+    ----------
+    T_C : float
+        Temperature [C].
+    material : str, optional
+        Fluid in the :mod:`materials` registry.
+    B : float, optional
+        Magnetic field [T].
+    U, q : array_like, optional
+        Velocity [m/s] and heat flux [W/m^2] axes; by default ``n`` points
+        from 1e-4 to 5e-3 m/s and from 0.1 to 1 MW/m^2.
+    g : float, optional
+        Gravitational acceleration [m/s^2].
+    ha2_over_re, gr_over_ha2 : float, optional
+        Target interaction parameters.
+    n : int, optional
+        Points per default axis.
+    """
+    import plotting
+
+    s = property_state(material, T_C)
+    U = np.linspace(1e-4, 5e-3, n) if U is None else np.asarray(U, dtype=float)
+    q = np.linspace(1e5, 1e6, n) if q is None else np.asarray(q, dtype=float)
+    U_grid, q_grid = np.meshgrid(U, q)
+    L_ha = mhd.characteristic_length_from_Ha_ratio(B, s.sigma, s.rho, U_grid, ha2_over_re)
+    L_gr = mhd.characteristic_length_from_Gr_ratio(
+        B, s.sigma, s.rho, s.nu, g, s.beta, q_grid, s.k, gr_over_ha2)
+    q_match, _ = mhd.length_match_heat_flux(
+        U, B, s.sigma, s.rho, s.nu, g, s.beta, s.k, ha2_over_re, gr_over_ha2)
+    return plotting.plot_length_match(
+        U_grid, q_grid / 1e6, 0.5 * (L_ha + L_gr), L_ha - L_gr,
+        title=f"T={T_C:g}C", match=(U, q_match / 1e6),
+    )
+
+
+def length_match_jobs(temperatures=REPORT_TEMPERATURES, directory=".", **kwargs):
+    """One :class:`FigureJob` per temperature, saved as ``length_match_<T>C.png``.
+
+    ``kwargs`` are passed on to :func:`length_match_figure`.
+    """
+    return [
+        FigureJob(os.path.join(directory, f"length_match_{T:g}C.png"),
+                  length_match_figure, (float(T),), dict(kwargs))
+        for T in np.asarray(temperatures, dtype=float)
+    ]
+
+
+def main(argv=None):
+    """Render the length-match report headlessly."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="number of rendering processes")
+    parser.add_argument("--out", metavar="DIR", default=".",
+                        help="directory for the figures")
+    parser.add_argument("--temperatures", type=float, nargs="+",
+                        default=list(REPORT_TEMPERATURES), metavar="T_C",
+                        help="operating temperatures [C]")
+    parser.add_argument("--material", default="material_props",
+                        help="fluid in the materials registry")
+    args = parser.parse_args(argv)
+
+    use_headless()
+    jobs = length_match_jobs(args.temperatures, args.out, material=args.material)
+    for path in render_jobs(jobs, workers=args.workers):
+        print(f"Saved figure: {path}")
+
+
+if __name__ == "__main__":
+    main()
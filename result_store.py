@@ -0,0 +1,245 @@
+"""On-disk store for design-space sweep results.
+
+Each sweep is written to ``<root>/<key>/`` with one ``.npy`` file per column
+and a ``meta.json`` describing the sweep. ``key`` is a hash of the sweep
+definition (axes, material, targets, ...), so identical studies map
+to the same directory. Columns are reopened as read-only memory maps, which
+makes multi-GB sweeps available instantly without copying them into RAM.
+"""
+import glob
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+import design_space as ds
+
+DEFAULT_ROOT = "sweep_results"
+
+
+def _canonical(value):
+    """JSON-serialisable form of a definition value."""
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items())}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def sweep_definition(T_C, B, L, U, q, material="Pb17Li",
+                     targets=None, g=ds.G, **extra):
+    """Dictionary describing a sweep, used to derive its store key.
+
+    Parameters
+    ----------
+    T_C, B, L, U, q : array_like
+        Sweep axes.
+    material : str, optional
+        Fluid in the :mod:`materials` registry the sweep was evaluated with.
+    targets : dict, optional
+        Target interaction parameters, e.g. ``{"I_ha2_over_re": 8.22e5}``.
+    g : float, optional
+        Gravitational acceleration [m/s^2].
+    **extra
+        Any further settings that change the results.
+    """
+    definition = {
+        "axes": {name: np.asarray(a, dtype=float).ravel()
+                 for name, a in zip(ds.AXES, (T_C, B, L, U, q))},
+        "material": material,
+        "targets": dict(targets or {}),
+        "g": g,
+    }
+    definition.update(extra)
+    return definition
+
+
+def sweep_key(definition):
+    """Stable hex digest of a sweep definition."""
+    text = json.dumps(_canonical(definition), sort_keys=True)
+    return hashlib.sha256(text.encode()).hexdigest()[:32]
+
+
+def _path(root, key):
+    return os.path.join(root, key)
+
+
+def exists(key, root=DEFAULT_ROOT):
+    """True if a complete result set is stored under ``key``."""
+    return os.path.isfile(os.path.join(_path(root, key), "meta.json"))
+
+
+def _commit(tmp, root, key, meta):
+    """Write ``meta.json`` last and move the directory into place."""
+    with open(os.path.join(tmp, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+    target = _path(root, key)
+    if os.path.isdir(target):
+        shutil.rmtree(target)
+    os.replace(tmp, target)
+    return target
+
+
+def save_columns(columns, key, root=DEFAULT_ROOT, meta=None):
+    """Store in-memory columns under ``key``.
+
+    Returns
+    -------
+    str
+        Directory the columns were written to.
+    """
+    os.makedirs(root, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=root, prefix=".tmp-")
+    for name, values in columns.items():
+        np.save(os.path.join(tmp, f"{name}.npy"), np.ascontiguousarray(values))
+    meta = _canonical(dict(meta or {}, columns=list(columns), key=key))
+    return _commit(tmp, root, key, meta)
+
+
+def write_sweep(T_C, B, L, U, q, root=DEFAULT_ROOT, block_size=1_000_000,
+                g=ds.G, material="Pb17Li", walls=None, t_w=None, **definition):
+    """Stream a design-space sweep straight into the store.
+
+    Blocks from :func:`design_space.iter_blocks` are written into
+    pre-allocated ``.npy`` memory maps, so sweeps larger than RAM can be
+    stored. Nothing is recomputed if the sweep is already stored. ``walls``
+    and ``t_w`` add the wall axes, see :func:`design_space.sweep`.
+
+    Returns
+    -------
+    str
+        Store key of the sweep.
+    """
+    if walls is not None:
+        definition.update(walls=list(walls), t_w=np.asarray(t_w, dtype=float).ravel())
+    spec = sweep_definition(T_C, B, L, U, q, material=material, g=g, **definition)
+    key = sweep_key(spec)
+    if exists(key, root):
+        return key
+
+    names = ds.column_names(walls)
+    axes = ds.sweep_axes(T_C, B, L, U, q, material, walls, t_w)
+    total = int(np.prod([a.size for a in axes]))
+    os.makedirs(root, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=root, prefix=".tmp-")
+    maps = {name: open_memmap(os.path.join(tmp, f"{name}.npy"), mode="w+",
+                              dtype=float, shape=(total,))
+            for name in names}
+    start = 0
+    blocks = ds.iter_blocks(T_C, B, L, U, q, block_size=block_size, g=g,
+                            material=material, walls=walls, t_w=t_w)
+    for block in blocks:
+        stop = start + len(block[ds.AXES[0]])
+        for name, values in block.items():
+            maps[name][start:stop] = values
+        start = stop
+    for values in maps.values():
+        values.flush()
+    del maps
+
+    _commit(tmp, root, key, {"columns": list(names), "key": key,
+                             "definition": _canonical(spec)})
+    return key
+
+
+def load_columns(key, root=DEFAULT_ROOT, mmap_mode="r"):
+    """Reopen stored columns as memory maps (or arrays if ``mmap_mode=None``).
+
+    Raises
+    ------
+    KeyError
+        If nothing is stored under ``key``.
+    """
+    if not exists(key, root):
+        raise KeyError(f"no stored sweep {key!r} in {root!r}")
+    path = _path(root, key)
+    with open(os.path.join(path, "meta.json")) as f:
+        meta = json.load(f)
+    return {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+            for name in meta["columns"]}
+
+
+# Content-addressed caching ---------------------------------------------------
+
+# Modules whose source determines the numbers in a stored sweep
+SOURCE_PATTERNS = (
+    "prop_correlations_*.py",
+    "material_props.py",
+    "materials.py",
+    "property_state.py",
+    "property_table.py",
+    "mhd_scaling.py",
+    "design_space.py",
+)
+
+
+def source_fingerprint(patterns=SOURCE_PATTERNS):
+    """Hash of the material-correlation and scaling source files.
+
+    Editing any correlation changes the fingerprint, so results cached under
+    :func:`fingerprint` are invalidated automatically.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for pattern in patterns:
+        for path in sorted(glob.glob(os.path.join(here, pattern))):
+            digest.update(os.path.basename(path).encode())
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def fingerprint(definition, patterns=SOURCE_PATTERNS):
+    """Store key covering both the study definition and the source code."""
+    return sweep_key({"definition": definition, "source": source_fingerprint(patterns)})
+
+
+def cached_columns(key, compute, root=DEFAULT_ROOT, meta=None):
+    """Stored columns for ``key``, or ``compute()`` saved under ``key``.
+
+    Parameters
+    ----------
+    key : str
+        Usually from :func:`fingerprint`.
+    compute : callable
+        Returns a dict of column arrays; only called on a cache miss.
+    """
+    if exists(key, root):
+        return load_columns(key, root)
+    columns = compute()
+    save_columns(columns, key, root, meta=meta)
+    return columns
+
+
+def cached_figure(key, name, render, root=DEFAULT_ROOT, **savefig_kwargs):
+    """Path of figure ``name`` stored with ``key``, rendering it if missing.
+
+    Parameters
+    ----------
+    key : str
+        Key of an existing stored result (see :func:`cached_columns`).
+    name : str
+        File name of the figure, e.g. ``"length_match_330C.png"``.
+    render : callable
+        Returns a matplotlib figure; only called on a cache miss.
+
+    Returns
+    -------
+    tuple
+        ``(path, rendered)`` where ``rendered`` is False on a cache hit.
+    """
+    path = os.path.join(_path(root, key), name)
+    if os.path.isfile(path):
+        return path, False
+    fig = render()
+    fig.savefig(path, **savefig_kwargs)
+    import matplotlib.pyplot as plt  # only needed once something was rendered
+
+    plt.close(fig)
+    return path, True
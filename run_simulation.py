@@ -1,9 +1,15 @@
+import os
+import shutil
+
 import numpy as np
-import matplotlib.pyplot as plt
 
-import material_props as props
+import design_optimizer
 import mhd_scaling as mhd
-import plotting
+from lazy_grid import power_law_grid
+import render
+import result_store
+from instrumentation import stage
+from property_state import property_state
 
 # Target DEMO interaction parameters
 HA2_OVER_RE = 8.22e5
@@ -39,149 +45,242 @@ def velocities_from_flowrate(Q_m3_per_h, L_array):
     return U_array
 
 
-def main() -> None:
-    """Generate L(Ha)-L(Re)-U and L(Ha)-L(Gr)-q'' plots at 330°C."""
+def length_match_study(T=330, material="material_props", cache_dir=None):
+    """L(Ha)-L(Re)-U and L(Ha)-L(Gr)-q'' grids at temperature ``T`` [C].
+
+    Numeric only; matplotlib is not imported. When ``cache_dir`` is given,
+    the grids are stored there under a fingerprint of the study constants
+    and the correlation source, and are reused on later runs until either
+    changes.
 
-    T = 330  # Celsius
-    sigma = props.sigma(T)
-    rho = props.rho(T)
-    nu = props.nu(T)
-    k = props.k(T)
-    beta = props.beta(T)
+    Returns
+    -------
+    dict
+        ``T``, the property ``state``, the design ``best`` matching DEMO
+        (see :func:`design_optimizer.nearest_to_demo`), the axes ``q``,
+        ``Ha_array``, ``L_re`` and ``U_array``, the grids ``L_gr`` and
+        ``Ha``, the cache ``key`` (None without ``cache_dir``), the length
+        axes ``L_ha`` and ``L_gr_axis`` [m], and the factored maps ``q_grid``
+        (heat flux [MW/m^2] over L_Gr x L_Ha) and ``u_grid`` (velocity [m/s]
+        over L_Re x L_Ha), see :class:`lazy_grid.FactoredGrid`.
+    """
+    state = property_state(material, T)
+    sigma = state.sigma
+    rho = state.rho
+    nu = state.nu
+    k = state.k
+    beta = state.beta
+
+    # Closest facility design to the DEMO targets (B <= B, Q <= Q_max)
+    with stage("optimizer"):
+        best = design_optimizer.nearest_to_demo(
+            T, material=material, B_range=(design_optimizer.B_RANGE[0], B),
+            flow_range=(design_optimizer.FLOW_RANGE[0], Q_max),
+            ha2_over_re=HA2_OVER_RE, gr_over_ha2=GR_OVER_HA2, g=G,
+        )
 
     L_ha = L_HA_MM / 1e3
     L_gr = L_GR_MM / 1e3
     L_re = L_RE_MM / 1e3
 
-    L_ha_mm = L_HA_MM
-    L_gr_mm = L_GR_MM
-    L_re_mm = L_RE_MM
-    
     U_array = velocities_from_flowrate(6.0, L_re)
     U_array = np.linspace(0, 0.005, 20)
-    
+
     Ha_array = mhd.hartmann_number(B, L_ha, sigma, rho, nu)
-    Re_array = mhd.reynolds_number(U, L_re, nu)
-    Gr_array = mhd.grashof_number(G, beta, q, L_gr, k, nu)
-    
-    
-    results = []
-    for Ha in Ha_array:
-        row = []
-        for heat_flux in q:
-            
-            Gr = GR_OVER_HA2 * Ha**2
-            value = mhd.length_from_grashof(Gr, G, beta, heat_flux, k, nu)
-            
-            row.append(value)
-        results.append(row)
-        
-    print(results)
-    
-
-    
-    Ha_array = np.array(Ha_array)              # shape: (n,)
-    q_array = np.array(q)                      # shape: (m,)
-    Z = np.array(results)                      # shape: (n, m)
-    
+
+    # q'' and U over the length grids, kept as 1D factors (rows follow the
+    # second length, as np.meshgrid(L_ha, ...) does); q'' does not depend on L_Ha
+    q_grid = power_law_grid(
+        mhd.heat_flux_from_length, {"L_gr": L_gr}, B=B, sigma=sigma, rho=rho,
+        nu=nu, g=G, beta=beta, k=k, gr_over_ha2=GR_OVER_HA2,
+    ).expand_dims(-1) / 1e6  # MW/m^2
+    u_grid = power_law_grid(
+        mhd.velocity_from_lengths, {"L_re": L_re, "L_ha": L_ha}, B=B, sigma=sigma,
+        rho=rho, nu=nu, ha2_over_re=HA2_OVER_RE,
+    )
+
+    # Every constant the cached grids and figures are drawn from
+    definition = {
+        "study": "run_simulation", "material": material, "T_C": T,
+        "B": B, "G": G, "L_HA_MM": L_HA_MM, "L_GR_MM": L_GR_MM, "L_RE_MM": L_RE_MM, "q": q,
+        "U_array": U_array, "HA2_OVER_RE": HA2_OVER_RE, "GR_OVER_HA2": GR_OVER_HA2,
+    }
+
+    def compute():
+        with stage("groups", points=Ha_array.size * q.size + U_array.size * L_re.size):
+            # L_Gr for every (Ha, q'') pair in one broadcast pass
+            Gr = GR_OVER_HA2 * Ha_array[:, np.newaxis]**2
+            results = mhd.length_from_grashof(Gr, G, beta, q[np.newaxis, :], k, nu)
+            # Ha implied by Ha^2/Re for every (U, L_Re) pair
+            Re = mhd.reynolds_number(U_array[:, np.newaxis], L_re[np.newaxis, :], nu)
+            results2 = (HA2_OVER_RE * Re)**0.5
+        return {"L_gr": results, "Ha": results2}
+
+    key = None
+    if cache_dir:
+        # Figures are drawn here and in plotting from maps built by lazy_grid,
+        # so their source counts too
+        figure_sources = ("run_simulation.py", "plotting.py", "lazy_grid.py")
+        key = result_store.fingerprint(definition,
+                                       result_store.SOURCE_PATTERNS + figure_sources)
+        grids = result_store.cached_columns(key, compute, cache_dir,
+                                            meta={"definition": definition})
+    else:
+        grids = compute()
+
+    return {
+        "T": T, "state": state, "best": best, "key": key,
+        "q": q, "Ha_array": Ha_array, "L_re": L_re, "U_array": U_array,
+        "L_gr": grids["L_gr"], "Ha": grids["Ha"],
+        "L_ha": L_ha, "L_gr_axis": L_gr, "q_grid": q_grid, "u_grid": u_grid,
+    }
+
+
+def plot_length_vs_heat_flux(study):
+    """Surface of L_Gr over heat flux and Hartmann number."""
+    import matplotlib.pyplot as plt
+
     # Create meshgrid for X and Y axes
-    Q_mesh, Ha_mesh = np.meshgrid(q_array, Ha_array)  # shape: (n, m)
-    
+    Q_mesh, Ha_mesh = np.meshgrid(study["q"], study["Ha_array"])  # shape: (n, m)
+
     # Create 3D surface plot
     fig = plt.figure(figsize=(10, 6))
     ax = fig.add_subplot(111, projection='3d')
-    surf = ax.plot_surface(Q_mesh, Ha_mesh, Z, cmap='viridis', edgecolor='none')
-    
+    surf = ax.plot_surface(Q_mesh, Ha_mesh, study["L_gr"], cmap='viridis', edgecolor='none')
+
     # Labels and title
     ax.set_xlabel("Heat Flux $q''$ [W/m²]")
     ax.set_ylabel("Hartmann Number (Ha)")
     ax.set_zlabel("Characteristic Length $L$ [m]")
     ax.set_title("Characteristic Length vs Heat Flux and Hartmann Number")
-    
+
     # Colorbar
     fig.colorbar(surf, shrink=0.5, aspect=10)
-    
-    plt.tight_layout()
-    plt.show()
-      
-
+    fig.tight_layout()
+    return fig
 
-    results2 = []
-    for u in U_array:
-        row = []
-        for L in L_re:
-            
-            Re = mhd.reynolds_number(u, L, nu)
-            value = (HA2_OVER_RE * Re)**0.5 
-            
-            row.append(value)
-        results2.append(row)
-        
-    print(results2)
 
+def plot_ha_vs_velocity(study):
+    """Surface of the Hartmann number implied by Ha²/Re over L and U."""
+    import matplotlib.pyplot as plt
 
+    s, L_re, U_array = study["state"], study["L_re"], study["U_array"]
 
-
-    # Assuming U_array, L_re, results2 are already defined
-    U_array = np.array(U_array)        # shape (m,)
-    L_array = np.array(L_re)           # shape (n,)
-    Z = np.array(results2)             # shape (m, n)
-    
     # Create meshgrid for plotting
-    L_mesh, U_mesh = np.meshgrid(L_array, U_array)  # shape (m, n)
-    
+    L_mesh, U_mesh = np.meshgrid(L_re, U_array)  # shape (m, n)
+
     # Plot
     fig = plt.figure(figsize=(10, 6))
     ax = fig.add_subplot(111, projection='3d')
-    surf = ax.plot_surface(L_mesh, U_mesh, Z, cmap='viridis', edgecolor='none')
-    
+    surf = ax.plot_surface(L_mesh, U_mesh, study["Ha"], cmap='viridis', edgecolor='none')
+
     # Max Ha overlay
-    Ha_max = B * L_array * np.sqrt(sigma / (rho * nu))
-    U_line = np.full_like(L_array, U_array.max())
-    ax.plot(L_array, U_line, Ha_max, color='red', linewidth=2.5, label='Max Ha (facility)')
-    
-    # Labels, legend, show
+    Ha_max = B * L_re * np.sqrt(s.sigma / (s.rho * s.nu))
+    U_line = np.full_like(L_re, U_array.max())
+    ax.plot(L_re, U_line, Ha_max, color='red', linewidth=2.5, label='Max Ha (facility)')
+
+    # Labels, legend
     ax.set_xlabel("Characteristic Length $L$ [m]")
     ax.set_ylabel("Flow Velocity $U$ [m/s]")
     ax.set_zlabel("Hartmann Number (Ha)")
     ax.set_title("Hartmann Number vs Flow Velocity and Length")
     ax.legend()
     fig.colorbar(surf, shrink=0.5, aspect=10)
-    plt.tight_layout()
-    plt.show()
+    fig.tight_layout()
+    return fig
 
-    """
 
-    # Compute q'' and U for each length combination
-    LHA_grid, LGR_grid = np.meshgrid(L_ha, L_gr, indexing="xy")
-    q_grid = mhd.heat_flux_from_length(
-        LGR_grid, B, sigma, rho, nu, G, beta, k, GR_OVER_HA2
-    ) / 1e6  # convert to MW/m^2
+def plot_heat_flux_vs_lengths(study):
+    """:func:`plotting.plot_Lha_Lgr_q` of the factored heat-flux map."""
+    import plotting
 
-    LHA_grid_U, LRE_grid_U = np.meshgrid(L_ha, L_re, indexing="xy")
-    u_grid = mhd.velocity_from_lengths(
-        LHA_grid_U, LRE_grid_U, B, sigma, rho, nu, HA2_OVER_RE
+    fig, _ = plotting.plot_Lha_Lgr_q(
+        study["L_ha"], study["L_gr_axis"], study["q_grid"],
+        title=f"L_Ha vs L_Gr vs heat flux (T={study['T']:g}C)",
     )
+    return fig
 
-    fig1, _ = plotting.plot_Lha_Lgr_q(
-        L_ha_mm,
-        L_gr_mm,
-        q_grid,
-        title="L_Ha vs L_Gr vs heat flux (T=330C)",
-    )
-    fig1.savefig("Lha_Lgr_heatflux.png")
 
-    fig2, _ = plotting.plot_Lha_Lre_u(
-        L_ha_mm,
-        L_re_mm,
-        u_grid,
-        title="L_Ha vs L_Re vs velocity (T=330C)",
+def plot_velocity_vs_lengths(study):
+    """:func:`plotting.plot_Lha_Lre_u` of the factored velocity map."""
+    import plotting
+
+    fig, _ = plotting.plot_Lha_Lre_u(
+        study["L_ha"], study["L_re"], study["u_grid"],
+        title=f"L_Ha vs L_Re vs velocity (T={study['T']:g}C)",
     )
-    fig2.savefig("Lha_Lre_velocity.png")
+    return fig
+
+
+FIGURES = {
+    "L_vs_heatflux_Ha.png": plot_length_vs_heat_flux,
+    "Ha_vs_velocity_L.png": plot_ha_vs_velocity,
+    "Lha_Lgr_heatflux.png": plot_heat_flux_vs_lengths,
+    "Lha_Lre_velocity.png": plot_velocity_vs_lengths,
+}
 
-    plt.show()
+
+def main(cache_dir=None, out_dir=None, plot=True) -> None:
+    """Generate L(Ha)-L(Re)-U and L(Ha)-L(Gr)-q'' plots at 330°C.
+
+    When ``cache_dir`` is given, grids and figures are stored there under a
+    fingerprint of the study constants and the correlation source, and are
+    reused on later runs until either changes. When ``out_dir`` is given the
+    figures are saved there with the Agg backend instead of being shown,
+    copied from the cache when ``cache_dir`` is given too.
+    With ``plot=False`` only the numbers are printed.
     """
+    study = length_match_study(330, cache_dir=cache_dir)
+    T, best = study["T"], study["best"]
+    print(
+        f"Nearest to DEMO at {T} C: B = {best['B']:.2f} T, L = {best['L']:.4f} m, "
+        f"U = {best['U']:.2e} m/s, q'' = {best['q']:.2e} W/m^2 "
+        f"(Ha^2/Re = {best['I_ha2_over_re']:.3e}, Gr/Ha^2 = {best['I_gr_over_ha2']:.3e}, "
+        f"{best['log_distance']:.3f} decades off; "
+        f"c_w = {best['c_w']:.3f} with a {best['t_w'] * 1e3:.1f} mm EUROFER wall)"
+    )
+
+    print(study["L_gr"])
+    print(study["Ha"])
+    if not plot:
+        return
+
+    if out_dir:
+        render.use_headless()
+        os.makedirs(out_dir, exist_ok=True)
+    for name, plot_figure in FIGURES.items():
+        def draw():
+            return plot_figure(study)
+
+        with stage("plot"):
+            if cache_dir:
+                # Re-render only when the study or a correlation has changed
+                path, rendered = result_store.cached_figure(study["key"], name, draw, cache_dir)
+                print(f"{'Rendered' if rendered else 'Cached'} figure: {path}")
+                if out_dir:
+                    print(f"Saved figure: {shutil.copy(path, os.path.join(out_dir, name))}")
+                else:
+                    render.show_image(path)
+            elif out_dir:
+                print(f"Saved figure: {render.show_or_save(draw(), os.path.join(out_dir, name))}")
+            else:
+                render.show_or_save(draw())
+
+
+def cli(argv=None):
+    """Command-line entry point of :func:`main`."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description=main.__doc__.splitlines()[0])
+    parser.add_argument("--cache", metavar="DIR",
+                        help="reuse stored grids and figures from this directory")
+    parser.add_argument("--out", metavar="DIR",
+                        help="save the figures here headlessly instead of showing them")
+    parser.add_argument("--no-plot", action="store_true",
+                        help="numeric results only; matplotlib is never imported")
+    args = parser.parse_args(argv)
+    main(cache_dir=args.cache, out_dir=args.out, plot=not args.no_plot)
 
 
 if __name__ == "__main__":
-    main()
+    cli()
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+import mhd_scaling as mhd
+from adaptive_sweep import contour_points, length_match_residual, refine
+from design_query import DEMO_TARGETS
+from property_state import property_state
+
+U_RANGE, Q_RANGE = (1e-4, 5e-3), (0.1, 1e4)
+
+
+@pytest.mark.parametrize("T_C", [300.0, 330.0, 400.0])
+def test_refined_contour_matches_length_match_heat_flux(T_C):
+    n, depth = 9, 6
+    result = refine(length_match_residual(T_C), U_RANGE, Q_RANGE, n=n, max_depth=depth,
+                    log=(True, True))
+    cells = result["cells"]
+    s = property_state("material_props", T_C)
+
+    def q_match(U):
+        return mhd.length_match_heat_flux(
+            U, 4.0, s.sigma, s.rho, s.nu, 9.81, s.beta, s.k,
+            DEMO_TARGETS["I_ha2_over_re"], DEMO_TARGETS["I_gr_over_ha2"])[0]
+
+    # Every refined cell brackets the analytic contour (q_match falls with U)
+    assert len(cells) > 0
+    assert np.all(q_match(cells[:, 1]) <= cells[:, 3] * (1 + 1e-12))
+    assert np.all(q_match(cells[:, 0]) >= cells[:, 2] * (1 - 1e-12))
+    # and the cell centres trace it across the whole U range of the box
+    U, q = contour_points(cells)
+    np.testing.assert_allclose(q, q_match(U), rtol=0.02)
+    assert U.min() < U_RANGE[0] * 1.01 and U.max() > U_RANGE[1] * 0.99
+
+    # Far fewer evaluations than a uniform grid at the finest resolution
+    fine = ((n - 1) * 2**depth + 1) ** 2
+    assert result["value"].size < 0.05 * fine
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from scipy.optimize import lsq_linear
+
+import design_optimizer as opt
+import materials
+from property_state import property_state
+
+T_C = np.array([300.0, 400.0, 500.0])
+
+
+def reference_distance(T, B_range=opt.B_RANGE, flow_range=opt.FLOW_RANGE, c_w=None,
+                       ha2_over_re=opt.DEMO_TARGETS["I_ha2_over_re"],
+                       gr_over_ha2=opt.DEMO_TARGETS["I_gr_over_ha2"]):
+    """Smallest log10 distance to the targets, from scipy's bounded least squares."""
+    s = property_state("material_props", T)
+    sigma_w = float(materials.get("EUROFER").properties(T)["sigma"])
+    rhs = [
+        np.log10(ha2_over_re * s.rho / s.sigma),
+        np.log10(gr_over_ha2 * s.k * s.nu * s.sigma / (opt.G * s.beta * s.rho)),
+    ]
+    A = opt._EXPONENTS[:2]
+    if c_w is not None:
+        rhs.append(np.log10(c_w * s.sigma / sigma_w))
+        A = opt._EXPONENTS
+    lower, upper = np.log10([B_range, opt.L_RANGE, flow_range, opt.Q_FLUX_RANGE,
+                             opt.T_W_RANGE]).T
+    solution = lsq_linear(A, np.array(rhs), bounds=(lower, upper), tol=1e-12)
+    return np.linalg.norm(A @ solution.x - rhs)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"B_range": (0.5, 1.0)},
+    {"flow_range": (1e-6, 1e-5), "B_range": (0.5, 2.0)},
+    {"c_w": 0.05},
+])
+def test_nearest_to_demo_matches_reference(kwargs):
+    best = opt.nearest_to_demo(T_C, **kwargs)
+    expected = [reference_distance(T, **kwargs) for T in T_C]
+    np.testing.assert_allclose(best["log_distance"], expected, atol=1e-6)
+
+
+def test_nearest_to_demo_respects_limits():
+    best = opt.nearest_to_demo(T_C, B_range=(0.5, 1.0))
+    assert np.all((best["B"] >= 0.5 * (1 - 1e-12)) & (best["B"] <= 1.0 * (1 + 1e-12)))
+    np.testing.assert_allclose(best["U"], best["Q"] / best["L"]**2)
+    assert np.all(best["log_distance"] > 0.1)
@@ -0,0 +1,46 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from design_query import DesignIndex
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(scope="module")
+def columns():
+    rng = np.random.default_rng(0)
+    return {"I_ha2_over_re": 10 ** rng.uniform(2, 7, 5000),
+            "I_gr_over_ha2": 10 ** rng.uniform(-1, 4, 5000)}
+
+
+@pytest.mark.parametrize("k", [1, 5, 5000, 6000])
+def test_nearest_matches_brute_force(columns, k):
+    distance, rows = DesignIndex(columns).nearest(k=k)
+    expected = np.hypot(np.log10(columns["I_ha2_over_re"] / 8.22e5),
+                        np.log10(columns["I_gr_over_ha2"] / 0.624))
+    order = np.argsort(expected, kind="stable")[:k]
+    np.testing.assert_array_equal(rows, order)
+    np.testing.assert_allclose(distance, expected[order], rtol=1e-12)
+
+
+def test_window_rows_within_tolerance(columns):
+    rows = DesignIndex(columns).window(1e5, 10.0, rtol=0.2)
+    x, y = columns["I_ha2_over_re"], columns["I_gr_over_ha2"]
+    inside = (np.abs(x / 1e5 - 1) <= 0.2) & (np.abs(y / 10.0 - 1) <= 0.2)
+    np.testing.assert_array_equal(rows, np.flatnonzero(inside))
+
+
+def test_numeric_capability_run_avoids_scipy():
+    script = (
+        "import sys, runpy\n"
+        "sys.argv = ['cli.py', 'capability', '--no-plot']\n"
+        "runpy.run_path('cli.py', run_name='__main__')\n"
+        "print(sorted({m.split('.')[0] for m in sys.modules} & {'scipy', 'pandas', 'matplotlib'}))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True,
+                         text=True, check=True).stdout
+    assert out.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+import design_space as ds
+
+AXES = (
+    np.linspace(270, 550, 5),
+    np.linspace(1, 4, 4),
+    np.linspace(0.005, 0.1, 5),
+    np.linspace(1e-4, 5e-3, 4),
+    np.linspace(1e5, 1e6, 3),
+)
+WALLS = {"walls": ["EUROFER", "316L"], "t_w": np.array([1e-3, 5e-3])}
+
+
+def assert_same_columns(actual, expected):
+    assert list(actual) == list(expected)
+    for name in expected:
+        np.testing.assert_array_equal(actual[name], expected[name], err_msg=name)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("split", ["Temp_C", "B_T"])
+def test_parallel_sweep_matches_sweep(workers, split):
+    assert_same_columns(ds.parallel_sweep(*AXES, workers=workers, split=split),
+                        ds.sweep(*AXES))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_sweep_matches_sweep_with_walls(workers):
+    assert_same_columns(ds.parallel_sweep(*AXES, workers=workers, split="wall", **WALLS),
+                        ds.sweep(*AXES, **WALLS))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_sweeps_reject_unknown_split(workers):
+    with pytest.raises(ValueError, match="split must be one of .*, got 'Ha'"):
+        ds.parallel_sweep(*AXES, workers=workers, split="Ha")
+    with pytest.raises(ValueError, match="split must be one of .*, got 'wall'"):
+        ds.parallel_stream_sweep(*AXES, [ds.RangeReducer()], workers=workers, split="wall")
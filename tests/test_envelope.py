@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+import design_space as ds
+from envelope import IncrementalHull, analytic_envelope, box_corners, hull_vertices
+
+T_C = np.linspace(270, 550, 5)
+B = np.linspace(1, 4, 4)
+L = np.linspace(0.005, 0.1, 10)
+U = np.linspace(1e-4, 5e-3, 10)
+Q = np.linspace(1e5, 1e6, 10)
+
+
+def sorted_rows(points):
+    return points[np.lexsort(points.T[::-1])]
+
+
+@pytest.fixture(scope="module")
+def grid():
+    return ds.sweep(T_C, B, L, U, Q)
+
+
+@pytest.mark.parametrize("columns", [("Gr", "I_ha2_over_re"), ("Re", "Ha"),
+                                     ("I_gr_over_ha2", "I_gr_over_re2")])
+def test_analytic_envelope_matches_grid_hull(grid, columns):
+    hull = IncrementalHull(columns)
+    hull.update(grid)
+    _, analytic = analytic_envelope(T_C, B, L, U, Q, columns=columns)
+    np.testing.assert_allclose(sorted_rows(analytic.vertices), sorted_rows(hull.vertices),
+                               rtol=1e-12)
+
+
+def test_analytic_summary_matches_grid(grid):
+    summary, _ = analytic_envelope(T_C, B, L, U, Q)
+    expected = ds.range_summary(grid)
+    assert list(summary) == list(expected)
+    for label, bounds in expected.items():
+        np.testing.assert_allclose(summary[label], bounds, rtol=1e-12, err_msg=label)
+
+
+def test_box_corners_accept_bounds_only():
+    corners = box_corners(T_C, B, L, U, Q)
+    from_bounds = box_corners(T_C, (1, 4), (0.005, 0.1), (1e-4, 5e-3), (1e5, 1e6))
+    for name, values in corners.items():
+        np.testing.assert_array_equal(from_bounds[name], values, err_msg=name)
+    assert len(corners["Temp_C"]) == 2**4 * np.count_nonzero(
+        ds.valid_temperatures(ds.fluid_properties(T_C)))
+
+
+@pytest.mark.parametrize("points", [
+    np.random.default_rng(0).normal(size=(20000, 2)),
+    np.log10(np.random.default_rng(1).random((5000, 2))),
+    np.array([[0, 0], [1, 0], [1, 1], [0, 1], [0.5, 0], [0.5, 0.5]], dtype=float),
+])
+def test_hull_vertices_match_qhull(points):
+    spatial = pytest.importorskip("scipy.spatial")
+    vertices = hull_vertices(points)
+    expected = points[spatial.ConvexHull(points).vertices]
+    np.testing.assert_array_equal(sorted_rows(vertices), sorted_rows(expected))
+    # Counter-clockwise: positive signed area
+    x, y = vertices.T
+    assert np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y) > 0
+
+
+def test_hull_vertices_degenerate():
+    collinear = np.array([[2, 2], [0, 0], [1, 1], [np.nan, 0]], dtype=float)
+    np.testing.assert_array_equal(hull_vertices(collinear), [[0, 0], [1, 1], [2, 2]])
+    assert hull_vertices(np.empty((0, 2))).shape == (0, 2)
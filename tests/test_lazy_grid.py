@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+import mhd_scaling as mhd
+from lazy_grid import FactoredGrid, power_law_grid
+
+PROPS = {"sigma": 7.6e5, "rho": 9.7e3, "nu": 1.8e-7}
+L_HA = np.linspace(0.01, 0.1, 7)
+L_RE = np.linspace(0.02, 0.2, 5)
+B = np.linspace(1.0, 4.0, 3)
+
+
+def test_velocity_grid_matches_meshgrid():
+    grid = power_law_grid(mhd.velocity_from_lengths, {"L_ha": L_HA, "L_re": L_RE, "B": B},
+                          ha2_over_re=8.22e5, **PROPS)
+    L_ha, L_re, b = np.meshgrid(L_HA, L_RE, B, indexing="ij")
+    expected = mhd.velocity_from_lengths(L_ha, L_re, b, ha2_over_re=8.22e5, **PROPS)
+    assert grid.shape == expected.shape
+    np.testing.assert_allclose(np.asarray(grid), expected, rtol=1e-12)
+
+
+def test_heat_flux_grid_matches_meshgrid():
+    L_gr = np.linspace(0.005, 0.1, 11)
+    grid = power_law_grid(mhd.heat_flux_from_length, {"L_gr": L_gr, "B": B},
+                          g=9.81, beta=1.2e-4, k=15.0, gr_over_ha2=0.624, **PROPS)
+    l_gr, b = np.meshgrid(L_gr, B, indexing="ij")
+    expected = mhd.heat_flux_from_length(l_gr, b, g=9.81, beta=1.2e-4, k=15.0,
+                                         gr_over_ha2=0.624, **PROPS)
+    np.testing.assert_allclose(np.asarray(grid), expected, rtol=1e-12)
+
+
+@pytest.fixture
+def grids():
+    rng = np.random.default_rng(0)
+    a = FactoredGrid([rng.uniform(1, 2, 4), rng.uniform(1, 2, 3), rng.uniform(1, 2, 5)], 2.5)
+    b = FactoredGrid([rng.uniform(1, 2, 4), rng.uniform(1, 2, 3), rng.uniform(1, 2, 5)], 0.5)
+    return a, b
+
+
+@pytest.mark.parametrize("key", [
+    1, slice(1, 3), (2, 0), (slice(None), 1), (1, slice(0, 2), 4),
+    (slice(1, None, 2), 2, slice(None, -1)), (np.int64(3), slice(None), np.int64(0)),
+])
+def test_getitem_matches_materialised(grids, key):
+    a, _ = grids
+    np.testing.assert_allclose(a[key], np.asarray(a)[key], rtol=1e-15)
+
+
+def test_getitem_rejects_fancy_indexing(grids):
+    a, _ = grids
+    with pytest.raises(IndexError):
+        a[[0, 1]]
+    with pytest.raises(IndexError):
+        a[0, 0, 0, 0]
+
+
+def test_tiles_cover_grid(grids):
+    a, _ = grids
+    blocks = list(a.tiles(3))
+    assert [index for index, _ in blocks] == [slice(0, 3), slice(3, 4)]
+    np.testing.assert_allclose(np.concatenate([block for _, block in blocks]), np.asarray(a))
+
+
+def test_expand_dims(grids):
+    a, _ = grids
+    for axis in (0, 1, 3, -1, -2):
+        expanded = a.expand_dims(axis)
+        np.testing.assert_allclose(np.asarray(expanded), np.expand_dims(np.asarray(a), axis))
+
+
+def test_arithmetic_stays_factored(grids):
+    a, b = grids
+    dense_a, dense_b = np.asarray(a), np.asarray(b)
+    cases = [
+        (a * b, dense_a * dense_b),
+        (a * 3.0, dense_a * 3.0),
+        (3.0 * a, 3.0 * dense_a),
+        (a / b, dense_a / dense_b),
+        (a / 4.0, dense_a / 4.0),
+        (4.0 / a, 4.0 / dense_a),
+        (a ** 1.5, dense_a ** 1.5),
+        (a ** -2, dense_a ** -2.0),
+        (-a, -dense_a),
+    ]
+    for result, expected in cases:
+        assert isinstance(result, FactoredGrid)
+        np.testing.assert_allclose(np.asarray(result), expected, rtol=1e-13)
+
+
+def test_arithmetic_with_grids_of_other_rank_raises(grids):
+    a, _ = grids
+    with pytest.raises(ValueError):
+        a * a.expand_dims(0)
+
+
+def test_arithmetic_with_arrays_materialises(grids):
+    # Not factored: ndarray operands fall back to dense NumPy arithmetic
+    a, _ = grids
+    factor = np.linspace(1, 2, 5)
+    result = a * factor
+    assert isinstance(result, np.ndarray)
+    np.testing.assert_allclose(result, np.asarray(a) * factor)
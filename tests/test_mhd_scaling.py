@@ -0,0 +1,59 @@
+import numpy as np
+
+import mhd_scaling as mhd
+
+# Pb-17Li-like properties at about 400 C
+SIGMA, RHO, NU, K, BETA, G = 8.5e5, 9720.0, 1.54e-7, 22.4, 1.23e-4, 9.81
+
+
+def central_difference(func, arguments, name, h=1e-6):
+    upper = func(**dict(arguments, **{name: arguments[name] + h}))
+    lower = func(**dict(arguments, **{name: arguments[name] - h}))
+    return (upper - lower) / (2 * h)
+
+
+def test_gradient_matches_finite_differences():
+    arguments = {"B": 4.0, "L": 0.05, "sigma": SIGMA, "rho": RHO, "nu": NU}
+    _, gradient = mhd.value_and_gradient(mhd.hartmann_number, **arguments)
+    for name in ("B", "L"):
+        np.testing.assert_allclose(
+            gradient[name], central_difference(mhd.hartmann_number, arguments, name),
+            rtol=1e-6)
+
+
+def test_gradient_at_zero_field():
+    B = np.array([0.0, 1.0, 2.0])
+    value, gradient = mhd.value_and_gradient(mhd.hartmann_number, B, 0.05, SIGMA, RHO, NU)
+    # Ha is linear in B, so dHa/dB is Ha at B = 1 everywhere, including B = 0
+    expected = mhd.hartmann_number(1.0, 0.05, SIGMA, RHO, NU)
+    np.testing.assert_allclose(gradient["B"], expected)
+    assert np.all(np.isfinite(gradient["L"]))
+    np.testing.assert_array_equal(gradient["L"][0], 0.0)
+
+
+def test_gradient_at_zero_heat_flux():
+    q = np.array([0.0, 5e5])
+    _, gradient = mhd.value_and_gradient(mhd.grashof_number, G, BETA, q, 0.01, K, NU)
+    expected = central_difference(
+        mhd.grashof_number, {"g": G, "beta": BETA, "q": 0.0, "L": 0.01, "k": K, "nu": NU},
+        "q")
+    np.testing.assert_allclose(gradient["q"], expected, rtol=1e-6)
+    np.testing.assert_array_equal(gradient["L"][0], 0.0)
+
+
+def test_gradient_at_zero_keeps_true_singularity():
+    # length_from_grashof ~ q**-0.25 is singular at q = 0
+    with np.errstate(divide="ignore"):
+        _, gradient = mhd.value_and_gradient(
+            mhd.length_from_grashof, 1e8, G, BETA, np.array([0.0, 1e5]), K, NU)
+    assert np.isneginf(gradient["q_flux"][0])
+    assert np.isfinite(gradient["q_flux"][1])
+
+
+def test_gradient_of_tuple_output_at_zero():
+    U = np.array([0.0, 1e-3])
+    with np.errstate(divide="ignore"):  # q'' ~ U**-2 is infinite at U = 0
+        _, (_, d_length) = mhd.value_and_gradient(
+            mhd.length_match_heat_flux, U, 4.0, SIGMA, RHO, NU, G, BETA, K, 8.22e5, 0.624)
+    # L is linear in U, so dL/dU is the same at U = 0 as anywhere else
+    np.testing.assert_allclose(d_length["U"][0], d_length["U"][1])
@@ -0,0 +1,101 @@
+import warnings
+
+import numpy as np
+import pytest
+
+import prop_correlations_Pb17atLi as pbli
+
+T = np.array([400.0, 600.0, 700.0, 900.0])  # K; the ends are outside 508 - 880 K
+INSIDE = np.array([False, True, True, False])
+
+
+def density_of(tempK):
+    return 10520.35 - 1.19051 * tempK
+
+
+def test_check_range_raise():
+    with pytest.raises(ValueError, match="2 of 4 values"):
+        pbli.checkRange(T, 508, 880, "density", "raise")
+    np.testing.assert_array_equal(pbli.checkRange(T[INSIDE], 508, 880, "density", "raise"),
+                                  T[INSIDE])
+
+
+def test_check_range_warn():
+    with pytest.warns(RuntimeWarning, match="2 of 4 values"):
+        checked = pbli.checkRange(T, 508, 880, "density", "warn")
+    np.testing.assert_array_equal(checked, T)
+
+
+def test_check_range_clip():
+    np.testing.assert_array_equal(pbli.checkRange(T, 508, 880, "density", "clip"),
+                                  [508.0, 600.0, 700.0, 880.0])
+
+
+def test_check_range_nan():
+    checked = pbli.checkRange(T, 508, 880, "density", "nan")
+    np.testing.assert_array_equal(np.isnan(checked), ~INSIDE)
+    np.testing.assert_array_equal(checked[INSIDE], T[INSIDE])
+
+
+def test_check_range_ignore():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        np.testing.assert_array_equal(pbli.checkRange(T, 508, 880, "density", "ignore"), T)
+
+
+def test_check_range_rejects_unknown_policy():
+    with pytest.raises(ValueError, match="outOfRange"):
+        pbli.checkRange(T, 508, 880, "density", "skip")
+
+
+@pytest.mark.parametrize("mode", pbli.OUT_OF_RANGE_MODES)
+def test_correlation_per_element(mode):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        if mode == "raise":
+            with pytest.raises(ValueError):
+                pbli.density(T, outOfRange=mode)
+            return
+        rho = pbli.density(T, outOfRange=mode)
+    assert rho.shape == T.shape
+    np.testing.assert_allclose(rho[INSIDE], density_of(T[INSIDE]))
+
+
+@pytest.mark.parametrize("mode", ["warn", "clip", "nan", "ignore"])
+def test_scalar_in_scalar_out(mode):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for tempK in (600.0, 900.0):
+            rho = pbli.density(tempK, outOfRange=mode)
+            assert np.ndim(rho) == 0 and isinstance(rho, float)
+    assert pbli.density(600.0) == pytest.approx(density_of(600.0))
+
+
+# Correlations that asserted their range in the original module default to
+# "raise"; those whose assert was commented out default to "ignore"
+# 1000 is outside the range of every correlation, in K and in C
+RAISING = ("specificHeat", "thermalDiffusivity", "volumetricThermalExpansionCoeff",
+           "surfaceTension", "vapourPressure", "speedOfSound")
+IGNORING = ("density", "thermalConductivity", "dynamicViscosity", "kinematicViscosity",
+            "electricalResistivity", "electricalConductivity")
+
+
+@pytest.mark.parametrize("name", RAISING)
+def test_asserting_correlations_raise_by_default(name):
+    with pytest.raises(ValueError):
+        getattr(pbli, name)(1000.0)
+
+
+@pytest.mark.parametrize("name", IGNORING)
+def test_unchecked_correlations_extrapolate_by_default(name):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert np.isfinite(getattr(pbli, name)(1000.0))
+
+
+def test_baseline_bounds_of_celsius_correlations():
+    # The original numeric bounds are kept: 508 - 873 and 513 - 783
+    assert pbli.speedOfSound(520.0) == pytest.approx(1876 - 0.306 * 520.0)
+    assert np.isfinite(pbli.vapourPressure(600.0))
+    with pytest.raises(ValueError):
+        pbli.speedOfSound(500.0)
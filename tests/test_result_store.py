@@ -0,0 +1,53 @@
+import glob
+import os
+
+import numpy as np
+
+import result_store
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFINITION = {"study": "test", "T_C": [300.0, 400.0]}
+
+
+def test_source_patterns_cover_property_modules():
+    sources = {os.path.basename(path)
+               for pattern in result_store.SOURCE_PATTERNS
+               for path in glob.glob(os.path.join(ROOT, pattern))}
+    assert {"materials.py", "property_state.py", "prop_correlations_Pb17atLi.py",
+            "mhd_scaling.py", "design_space.py"} <= sources
+
+
+def test_fingerprint_changes_with_source(tmp_path):
+    source = tmp_path / "correlation.py"
+    source.write_text("def rho(T):\n    return 9720.0\n")
+    patterns = (str(tmp_path / "*.py"),)
+    before = result_store.fingerprint(DEFINITION, patterns)
+    assert result_store.fingerprint(DEFINITION, patterns) == before
+
+    source.write_text("def rho(T):\n    return 9710.0\n")
+    assert result_store.fingerprint(DEFINITION, patterns) != before
+
+
+def test_cached_columns_recomputed_after_source_change(tmp_path):
+    source = tmp_path / "src" / "correlation.py"
+    source.parent.mkdir()
+    source.write_text("A = 1\n")
+    patterns = (str(tmp_path / "src" / "*.py"),)
+    store = str(tmp_path / "store")
+    calls = []
+
+    def compute():
+        calls.append(None)
+        return {"x": np.arange(3.0)}
+
+    key = result_store.fingerprint(DEFINITION, patterns)
+    result_store.cached_columns(key, compute, store)
+    result_store.cached_columns(key, compute, store)
+    assert len(calls) == 1
+
+    source.write_text("A = 2\n")
+    key = result_store.fingerprint(DEFINITION, patterns)
+    assert not result_store.exists(key, store)
+    np.testing.assert_array_equal(result_store.cached_columns(key, compute, store)["x"],
+                                  np.arange(3.0))
+    assert len(calls) == 2
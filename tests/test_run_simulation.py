@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+import run_simulation as rs
+
+# The heat-flux axis starts at q'' = 0, where L_Gr is infinite
+pytestmark = pytest.mark.filterwarnings("ignore:divide by zero:RuntimeWarning")
+
+# Module constants that the cached grids and figures are drawn from
+STUDY_CONSTANTS = ("B", "G", "L_HA_MM", "L_GR_MM", "L_RE_MM", "q",
+                   "HA2_OVER_RE", "GR_OVER_HA2")
+
+
+@pytest.fixture(scope="module")
+def base_key(tmp_path_factory):
+    return rs.length_match_study(cache_dir=str(tmp_path_factory.mktemp("cache")))["key"]
+
+
+@pytest.mark.parametrize("name", STUDY_CONSTANTS)
+def test_cache_key_changes_with_study_constant(name, base_key, monkeypatch, tmp_path):
+    monkeypatch.setattr(rs, name, np.asarray(getattr(rs, name)) * 1.01)
+    assert rs.length_match_study(cache_dir=str(tmp_path))["key"] != base_key
+
+
+def test_cache_key_changes_with_temperature(base_key, tmp_path):
+    assert rs.length_match_study(T=340, cache_dir=str(tmp_path))["key"] != base_key
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+import design_space as ds
+import mhd_scaling as mhd
+import uncertainty as unc
+
+T_C = np.array([300.0, 400.0, 500.0])[:, None, None, None]
+B = np.array([1.0, 4.0])[:, None, None]
+U = np.array([1e-3, 5e-3])[:, None]
+Q = np.array([1e5, 1e6])
+L = np.array([0.01, 0.08])
+N, SEED = 2000, 7
+
+
+def perturbed_properties(T_C, method="lhs"):
+    """Per-sample properties at every temperature: trailing sample axis."""
+    props = ds.fluid_properties(T_C)
+    f = unc.sample_factors(N, method=method, seed=SEED)
+    rho = props["rho"][..., None] * f["rho"]
+    mu = (props["nu"] * props["rho"])[..., None] * f["mu"]
+    return {
+        "sigma": props["sigma"][..., None] / f["resistivity"],
+        "rho": rho,
+        "nu": mu / rho,
+        "k": props["k"][..., None] * f["k"],
+        "beta": props["beta"][..., None] * f["beta"],
+    }
+
+
+def brute_force_band(values):
+    return np.moveaxis(np.percentile(values, unc.DEFAULT_PERCENTILES, axis=-1), 0, -1)
+
+
+def test_length_bands_match_pointwise_sampling():
+    bands = unc.length_bands(T_C, B, U, Q, n_samples=N, seed=SEED)
+    p = perturbed_properties(T_C)
+    b, u, q = B[..., None], U[..., None], Q[..., None]
+    L_ha = mhd.characteristic_length_from_Ha_ratio(
+        b, p["sigma"], p["rho"], u, unc.DEMO_TARGETS["I_ha2_over_re"])
+    L_gr = mhd.characteristic_length_from_Gr_ratio(
+        b, p["sigma"], p["rho"], p["nu"], ds.G, p["beta"], q, p["k"],
+        unc.DEMO_TARGETS["I_gr_over_ha2"])
+    shape = (3, 2, 2, 2, len(unc.DEFAULT_PERCENTILES))
+    for name, values in (("L_ha", L_ha), ("L_gr", L_gr)):
+        assert bands[name].shape == shape
+        np.testing.assert_allclose(bands[name], np.broadcast_to(brute_force_band(values), shape),
+                                   rtol=1e-10, err_msg=name)
+
+
+@pytest.mark.parametrize("method", ["lhs", "mc"])
+def test_group_bands_match_pointwise_sampling(method):
+    # One axis per input: T, B, L, U, q
+    T, b, l, u = T_C[..., None], B[..., None], L[:, None, None], U
+    bands = unc.group_bands(T, b, l, u, Q, n_samples=N, method=method, seed=SEED)
+    values = ds.evaluate(b[..., None], l[..., None], u[..., None], Q[..., None],
+                         perturbed_properties(T, method))
+    shape = (3, 2, 2, 2, 2, len(unc.DEFAULT_PERCENTILES))
+    for name in ds.GROUPS:
+        assert bands[name].shape == shape
+        np.testing.assert_allclose(bands[name],
+                                   np.broadcast_to(brute_force_band(values[name]), shape),
+                                   rtol=1e-10, err_msg=name)
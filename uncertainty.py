@@ -0,0 +1,145 @@
+import numpy as np
+
+import design_space as ds
+import mhd_scaling as mhd
+from design_query import DEMO_TARGETS
+
+# Relative scatter of the Pb-17Li correlations (prop_correlations_Pb17atLi)
+SCATTER = {
+    "rho": 0.0439,          # density
+    "mu": 0.1475,           # dynamic viscosity
+    "resistivity": 0.1183,  # electrical resistivity
+    "beta": 0.4941,         # volumetric thermal expansion coefficient
+    "k": 0.3772,            # thermal conductivity
+}
+
+DEFAULT_PERCENTILES = (5, 50, 95)
+
+
+def sample_factors(n_samples, scatter=SCATTER, method="lhs", seed=None):
+    """Multiplicative property perturbations, one array entry per sample.
+
+    Each property is scaled by ``1 + s * u`` with ``u`` uniform on
+    ``[-1, 1]``, i.e. the quoted scatter ``s`` is treated as the half-width
+    of the band around the correlation.
+
+    Parameters
+    ----------
+    n_samples : int
+        Number of samples.
+    scatter : dict, optional
+        Relative scatter per property.
+    method : {"lhs", "mc"}, optional
+        Latin-hypercube or plain Monte Carlo sampling.
+    seed : int, optional
+        Seed for :func:`numpy.random.default_rng`.
+
+    Returns
+    -------
+    dict
+        ``{name: ndarray of shape (n_samples,)}``.
+    """
+    rng = np.random.default_rng(seed)
+    if method == "lhs":
+        strata = np.column_stack([rng.permutation(n_samples) for _ in scatter])
+        u = (strata + rng.random((n_samples, len(scatter)))) / n_samples
+    elif method == "mc":
+        u = rng.random((n_samples, len(scatter)))
+    else:
+        raise ValueError(f"method must be 'lhs' or 'mc', got {method!r}")
+    u = 2 * u - 1
+    return {name: 1 + s * u[:, i] for i, (name, s) in enumerate(scatter.items())}
+
+
+def _perturbed_unit_properties(factors):
+    """Properties of a unit fluid under the sampled perturbations."""
+    rho = factors["rho"]
+    return {
+        "sigma": 1 / factors["resistivity"],
+        "rho": rho,
+        "nu": factors["mu"] / rho,
+        "k": factors["k"],
+        "beta": factors["beta"],
+    }
+
+
+def _band(nominal, relative, percentiles):
+    """Percentiles of ``nominal * relative`` over samples, for every point.
+
+    All lengths and groups are products of powers of the properties, so the
+    relative perturbation is the same at every design point and temperature,
+    and scaling by a positive nominal value commutes with percentiles.
+    """
+    quantiles = np.percentile(relative, percentiles)
+    return np.asarray(nominal)[..., np.newaxis] * quantiles
+
+
+def length_bands(T_C, B, U, q, percentiles=DEFAULT_PERCENTILES, n_samples=100_000,
+                 method="lhs", seed=None, ha2_over_re=DEMO_TARGETS["I_ha2_over_re"],
+                 gr_over_ha2=DEMO_TARGETS["I_gr_over_ha2"], g=ds.G):
+    """Percentile bands of ``L_Ha`` and ``L_Gr`` from correlation scatter.
+
+    Samples are pushed through the ``mhd_scaling`` length functions in one
+    batched pass on a unit fluid to get each sample's relative change, which
+    is then applied to the nominal lengths on the design grid. Memory is
+    ``O(n_samples + grid)`` rather than ``O(n_samples * grid)``.
+
+    Parameters
+    ----------
+    T_C, B, U, q : array_like
+        Temperature [C], field [T], velocity [m/s] and heat flux [W/m^2];
+        broadcast against each other.
+    percentiles : sequence of float, optional
+        Percentiles to report.
+    n_samples : int, optional
+        Number of property samples.
+    method : {"lhs", "mc"}, optional
+        Sampling method, see :func:`sample_factors`.
+    seed : int, optional
+        Random seed.
+    ha2_over_re, gr_over_ha2 : float, optional
+        Target interaction parameters.
+    g : float, optional
+        Gravitational acceleration [m/s^2].
+
+    Returns
+    -------
+    dict
+        ``L_ha`` and ``L_gr`` [m], each with the broadcast design shape plus
+        a trailing axis over ``percentiles``.
+    """
+    props = ds.fluid_properties(T_C)
+    sigma, rho, nu, k, beta = (props[n] for n in ("sigma", "rho", "nu", "k", "beta"))
+    L_ha = mhd.characteristic_length_from_Ha_ratio(B, sigma, rho, U, ha2_over_re)
+    L_gr = mhd.characteristic_length_from_Gr_ratio(B, sigma, rho, nu, g, beta, q, k, gr_over_ha2)
+    shape = np.broadcast_shapes(*(np.shape(a) for a in (T_C, B, U, q)))
+
+    p = _perturbed_unit_properties(sample_factors(n_samples, method=method, seed=seed))
+    rel_ha = mhd.characteristic_length_from_Ha_ratio(1.0, p["sigma"], p["rho"], 1.0, 1.0)
+    rel_gr = mhd.characteristic_length_from_Gr_ratio(
+        1.0, p["sigma"], p["rho"], p["nu"], 1.0, p["beta"], 1.0, p["k"], 1.0)
+    return {
+        "L_ha": _band(np.broadcast_to(L_ha, shape), rel_ha, percentiles),
+        "L_gr": _band(np.broadcast_to(L_gr, shape), rel_gr, percentiles),
+    }
+
+
+def group_bands(T_C, B, L, U, q, percentiles=DEFAULT_PERCENTILES, n_samples=100_000,
+                method="lhs", seed=None, g=ds.G):
+    """Percentile bands of Ha, Re, Gr and the interaction parameters.
+
+    Same approach and arguments as :func:`length_bands`, for a design grid
+    given by ``B``, ``L``, ``U`` and ``q``.
+
+    Returns
+    -------
+    dict
+        Every name in :data:`design_space.GROUPS`, each with the broadcast
+        design shape plus a trailing axis over ``percentiles``.
+    """
+    nominal = ds.evaluate(B, L, U, q, ds.fluid_properties(T_C), g=g)
+    shape = np.broadcast_shapes(*(np.shape(a) for a in (T_C, B, L, U, q)))
+    p = _perturbed_unit_properties(sample_factors(n_samples, method=method, seed=seed))
+    relative = ds.evaluate(1.0, 1.0, 1.0, 1.0, p, g=1.0)
+    return {name: _band(np.broadcast_to(nominal[name], shape), relative[name], percentiles)
+            for name in ds.GROUPS}